@@ -3,9 +3,12 @@ ChunkSmith Hybrid - Batches API
 Manage batch operations for folder-based PDF processing
 """
 
-import threading
+import asyncio
+import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from tempfile import SpooledTemporaryFile
 from typing import List, Optional
 
 from fastapi import APIRouter, File, Form, UploadFile
@@ -34,26 +37,64 @@ from ..core.storage import (
     load_batch,
     load_session,
     save_batch,
-    save_session,
+    save_sessions_bulk,
     list_batches,
     delete_batch,
 )
 from ..integrations.pdf_extractor import extract_pdf_to_pages
-from ..integrations.jsonl_parser import parse_jsonl
-from ..core.hashing import hash_chunk
+from ..integrations.jsonl_parser import aiter_upload_lines, parse_jsonl_stream
+from ..core.hashing import hash_chunks_batch
 from ..integrations.jsonl_parser import JSONLParseError
-from ..jobs import create_job, run_commit_job
+from ..jobs import create_job, submit_commit_job
 from ..core.storage import save_job
 
 router = APIRouter(prefix="/api/batches", tags=["batches"])
 
+# Shared process pool for PDF extraction: keeps CPU-bound PyMuPDF work off
+# the event loop and lets the files of one batch extract in parallel.
+_pdf_pool: Optional[ProcessPoolExecutor] = None
 
-def is_probably_jsonl(filename: Optional[str], content: bytes) -> bool:
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Lazily create the shared PDF extraction process pool."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _pdf_pool
+
+
+async def _read_upload_bounded(
+    upload_file: UploadFile, head: bytes, limit_bytes: int
+) -> Optional[bytes]:
+    """
+    Stream the rest of an upload into a spooled buffer with a hard size cap.
+
+    Reads 1MB at a time so an oversized file is rejected as soon as the
+    running size crosses `limit_bytes`, instead of being fully materialized
+    in RAM first. Returns the complete content (head + rest), or None if
+    the upload exceeds the cap.
+    """
+    with SpooledTemporaryFile(max_size=2 * 1024 * 1024) as spool:
+        spool.write(head)
+        size = len(head)
+        while chunk := await upload_file.read(1 << 20):
+            size += len(chunk)
+            if size > limit_bytes:
+                return None
+            spool.write(chunk)
+        spool.seek(0)
+        return spool.read()
+
+
+def is_probably_jsonl(filename: Optional[str], head: bytes) -> bool:
     """
     Heuristic to detect whether an uploaded file is JSONL/NDJSON.
 
     - Trusts filename extensions `.jsonl` and `.ndjson` (also `.json` as permissive)
-    - Otherwise, strips leading whitespace and checks the first byte for `{` or `[`.
+    - Otherwise, skips leading whitespace and checks the first byte for `{` or `[`.
+
+    Only a small header slice of the upload is needed, so callers can sniff
+    before deciding whether to stream the rest.
     """
     try:
         if filename:
@@ -61,15 +102,15 @@ def is_probably_jsonl(filename: Optional[str], content: bytes) -> bool:
             if lower.endswith(('.jsonl', '.ndjson', '.json')):
                 return True
 
-        if not content:
-            return False
-
-        s = content.lstrip()
-        if not s:
+        # Bounded scan past leading whitespace; no lstrip() copy
+        i = 0
+        size = len(head)
+        while i < size and head[i] in b' \t\r\n':
+            i += 1
+        if i >= size:
             return False
 
-        first = s[:1]
-        if first in (b'{', b'['):
+        if head[i] in b'{[':
             return True
     except Exception:
         return False
@@ -77,6 +118,194 @@ def is_probably_jsonl(filename: Optional[str], content: bytes) -> bool:
     return False
 
 
+def _build_jsonl_session(
+    doc_groups: dict,
+    warnings: "list[str]",
+    default_doc_id: str,
+    session_id: str,
+    batch_id: str,
+    now: datetime,
+) -> Session:
+    """
+    Assemble a Session from JSONL chunks grouped by doc_id.
+
+    CPU-bound (hashing, offset math, model construction) — callers run it
+    via asyncio.to_thread so the event loop stays responsive during large
+    imports.
+    """
+    # Totals are known up front, so pre-size the per-chunk/per-page lists
+    # and assign by index instead of growing them by append
+    total_chunks = sum(len(group) for group in doc_groups.values())
+    base_pages: list = [None] * len(doc_groups)
+    chunk_metadata: dict = {}
+    chunk_fields: list = [None] * total_chunks
+    hash_items: list = [None] * total_chunks
+    # (start, end) of each page's content in current_text
+    page_bounds: list = [None] * len(doc_groups)
+    chunk_i = 0
+
+    CHUNK_SEP = "\n\n---\n\n"
+    sep_len = len(CHUNK_SEP)
+    current_offset = 0
+
+    page_no = 0
+    for group_chunks in doc_groups.values():
+        page_no += 1
+        # Fallback id prefix formatted once per page, not per chunk
+        page_prefix = f"P{page_no:03d}-C"
+        page_start = current_offset
+
+        for idx, jc in enumerate(group_chunks):
+            chunk_id = jc.chunk_id or f"{page_prefix}{idx + 1:03d}"
+            chunk_text = jc.text
+            char_len = len(chunk_text)
+
+            start = current_offset
+            end = start + char_len
+
+            chunk_fields[chunk_i] = (chunk_id, page_no, start, end, char_len)
+            hash_items[chunk_i] = (chunk_id, chunk_text)
+            chunk_i += 1
+
+            chunk_metadata[chunk_id] = ChunkMetadata.model_construct(custom=jc.metadata)
+
+            # The trailing separator after the final chunk is trimmed below
+            current_offset = end + sep_len
+
+        page_bounds[page_no - 1] = (page_start, current_offset - sep_len)
+
+    # Every adjacent chunk pair — within and across pages alike — is
+    # separated by CHUNK_SEP, so one flat join builds the whole text
+    current_text = CHUNK_SEP.join(text for _, text in hash_items)
+
+    # Page texts are slices of current_text; no per-page joins. They are
+    # still materialized because sessions persist and serve RawPage.text.
+    for i, (p_start, p_end) in enumerate(page_bounds):
+        base_pages[i] = RawPage(page_no=i + 1, text=current_text[p_start:p_end])
+
+    # Hash all chunks in one batch call instead of per-chunk
+    chunk_hashes = hash_chunks_batch(default_doc_id, hash_items)
+    # model_construct skips per-instance validation; every field
+    # is computed locally from already-validated JSONL input.
+    chunks = [
+        ChildChunk.model_construct(
+            chunk_id=chunk_id,
+            page_no=chunk_page_no,
+            start=start,
+            end=end,
+            char_len=char_len,
+            hash=chunk_hash,
+            warnings=[],
+        )
+        for (chunk_id, chunk_page_no, start, end, char_len), chunk_hash
+        in zip(chunk_fields, chunk_hashes)
+    ]
+
+    # Build page_map (page hashes batched the same way); offsets come
+    # straight from the chunk bookkeeping, with no recomputation
+    page_hashes = hash_chunks_batch(
+        default_doc_id,
+        [(f"page-{page.page_no}", page.text) for page in base_pages],
+    )
+    page_map: list[PageSpan] = [
+        PageSpan.model_construct(
+            page_no=i + 1,
+            start=p_start,
+            end=p_end,
+            char_len=p_end - p_start,
+            hash=page_hash,
+        )
+        for i, ((p_start, p_end), page_hash) in enumerate(zip(page_bounds, page_hashes))
+    ]
+
+    extract_meta = ExtractMeta(
+        extractor_name="jsonl_import",
+        extractor_version="1.0",
+        page_count=len(base_pages),
+        warnings=warnings,
+        created_at=now,
+    )
+
+    chunk_strategy = ChunkStrategy(
+        chunk_size=settings.DEFAULT_CHUNK_SIZE,
+        overlap=0,
+        split_mode="chars",
+        normalize=False,
+    )
+
+    return Session(
+        session_id=session_id,
+        doc_id=default_doc_id,
+        batch_id=batch_id,
+        source_type="jsonl",
+        extract_meta=extract_meta,
+        base_pages=base_pages,
+        # Shared list: the JSONL path never mutates pages
+        current_pages=base_pages,
+        current_text=current_text,
+        page_map=page_map,
+        chunk_strategy=chunk_strategy,
+        chunks=chunks,
+        chunk_metadata=chunk_metadata,
+        version=1,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _build_pdf_session(
+    base_pages: "list[RawPage]",
+    extract_meta: ExtractMeta,
+    doc_id: str,
+    session_id: str,
+    batch_id: str,
+    now: datetime,
+) -> Session:
+    """
+    Assemble a Session from extracted PDF pages.
+
+    CPU-bound (normalization, chunking, hashing) — callers run it via
+    asyncio.to_thread so the event loop stays responsive.
+    """
+    # Default chunk strategy
+    chunk_strategy = ChunkStrategy(
+        chunk_size=settings.DEFAULT_CHUNK_SIZE,
+        overlap=settings.DEFAULT_OVERLAP,
+        split_mode=settings.DEFAULT_SPLIT_MODE,
+        normalize=settings.DEFAULT_NORMALIZE,
+    )
+
+    # Apply normalization if enabled
+    if chunk_strategy.normalize:
+        current_pages = normalize_pages(base_pages)
+    else:
+        current_pages = base_pages.copy()
+
+    # Build full text with page markers
+    current_text = build_text(current_pages)
+
+    # Build page map and chunks
+    page_map = build_page_map(current_text, current_pages, doc_id)
+    chunks = chunk_pages(current_text, page_map, current_pages, chunk_strategy, doc_id)
+
+    return Session(
+        session_id=session_id,
+        doc_id=doc_id,
+        batch_id=batch_id,  # Link to batch
+        extract_meta=extract_meta,
+        base_pages=base_pages,
+        current_pages=current_pages,
+        current_text=current_text,
+        page_map=page_map,
+        chunk_strategy=chunk_strategy,
+        chunks=chunks,
+        chunk_metadata={},
+        version=1,
+        created_at=now,
+        updated_at=now,
+    )
+
+
 @router.post("", response_model=BatchResponse)
 async def create_batch(
     files: List[UploadFile] = File(...),
@@ -98,141 +327,56 @@ async def create_batch(
     file_infos: List[BatchFileInfo] = []
     errors: List[str] = []
 
+    loop = asyncio.get_running_loop()
+    # (filename, placeholder BatchFileInfo, extraction future) per pending PDF
+    pending_pdfs: list[tuple[str, BatchFileInfo, "asyncio.Future"]] = []
+    # Sessions are flushed in one bulk write at the end of the request
+    sessions_to_save: list[Session] = []
+
     for upload_file in files:
         filename = upload_file.filename or f"unknown-{uuid.uuid4()[:8]}.pdf"
 
         try:
-            # Read file content
-            pdf_bytes = await upload_file.read()
+            # Sniff a 4KB header instead of materializing the whole upload
+            head = await upload_file.read(4096)
 
             # Detect JSONL vs PDF
-            if is_probably_jsonl(upload_file.filename, pdf_bytes):
+            if is_probably_jsonl(upload_file.filename, head):
                 try:
                     # Create session for this JSONL import
                     session_id = str(uuid.uuid4())
                     default_doc_id = upload_file.filename or f"jsonl-{session_id[:8]}"
 
-                    jsonl_chunks, warnings = parse_jsonl(pdf_bytes, default_doc_id)
-
-                    # Group chunks by doc_id to form pages
+                    # Stream-parse the upload line by line; doc_groups is built
+                    # incrementally so the raw file is never held in memory whole
+                    warnings: list[str] = []
                     doc_groups: dict = {}
-                    for jc in jsonl_chunks:
+                    async for jc in parse_jsonl_stream(
+                        aiter_upload_lines(upload_file, head), default_doc_id, warnings
+                    ):
                         doc_key = jc.doc_id or default_doc_id
                         doc_groups.setdefault(doc_key, []).append(jc)
 
-                    base_pages: list[RawPage] = []
-                    chunks: list[ChildChunk] = []
-                    chunk_metadata: dict = {}
-
-                    CHUNK_SEP = "\n\n---\n\n"
-                    current_text_parts: list[str] = []
-                    current_offset = 0
-
-                    page_no = 0
-                    for doc_key, group_chunks in doc_groups.items():
-                        page_no += 1
-                        page_texts = []
-
-                        for idx, jc in enumerate(group_chunks):
-                            chunk_id = jc.chunk_id or f"P{page_no:03d}-C{idx + 1:03d}"
-                            chunk_text = jc.text
-                            char_len = len(chunk_text)
-
-                            start = current_offset
-                            end = start + char_len
-
-                            chunk = ChildChunk(
-                                chunk_id=chunk_id,
-                                page_no=page_no,
-                                start=start,
-                                end=end,
-                                char_len=char_len,
-                                hash=hash_chunk(default_doc_id, chunk_id, chunk_text),
-                                warnings=[],
-                            )
-                            chunks.append(chunk)
-
-                            chunk_metadata[chunk_id] = ChunkMetadata(custom=jc.metadata)
-
-                            page_texts.append(chunk_text)
-                            current_text_parts.append(chunk_text)
-
-                            is_last_chunk = (
-                                doc_key == list(doc_groups.keys())[-1]
-                                and idx == len(group_chunks) - 1
-                            )
-                            if not is_last_chunk:
-                                current_text_parts.append(CHUNK_SEP)
-                                current_offset = end + len(CHUNK_SEP)
-                            else:
-                                current_offset = end
-
-                        page_text = CHUNK_SEP.join(page_texts)
-                        base_pages.append(RawPage(page_no=page_no, text=page_text))
-
-                    current_text = "".join(current_text_parts)
-
-                    # Build page_map
-                    offset = 0
-                    page_map: list[PageSpan] = []
-                    for page in base_pages:
-                        page_len = len(page.text)
-                        page_map.append(
-                            PageSpan(
-                                page_no=page.page_no,
-                                start=offset,
-                                end=offset + page_len,
-                                char_len=page_len,
-                                hash=hash_chunk(default_doc_id, f"page-{page.page_no}", page.text),
-                            )
-                        )
-                        offset += page_len
-                        if page.page_no < len(base_pages):
-                            offset += len(CHUNK_SEP)
-
-                    extract_meta = ExtractMeta(
-                        extractor_name="jsonl_import",
-                        extractor_version="1.0",
-                        page_count=len(base_pages),
-                        warnings=warnings,
-                        created_at=datetime.utcnow(),
-                    )
-
-                    chunk_strategy = ChunkStrategy(
-                        chunk_size=settings.DEFAULT_CHUNK_SIZE,
-                        overlap=0,
-                        split_mode="chars",
-                        normalize=False,
+                    # Hashing and assembly are CPU-bound; run off the event loop
+                    session = await asyncio.to_thread(
+                        _build_jsonl_session,
+                        doc_groups,
+                        warnings,
+                        default_doc_id,
+                        session_id,
+                        batch_id,
+                        now,
                     )
 
-                    now = datetime.utcnow()
-                    session = Session(
-                        session_id=session_id,
-                        doc_id=default_doc_id,
-                        batch_id=batch_id,
-                        source_type="jsonl",
-                        extract_meta=extract_meta,
-                        base_pages=base_pages,
-                        current_pages=base_pages.copy(),
-                        current_text=current_text,
-                        page_map=page_map,
-                        chunk_strategy=chunk_strategy,
-                        chunks=chunks,
-                        chunk_metadata=chunk_metadata,
-                        version=1,
-                        created_at=now,
-                        updated_at=now,
-                    )
-
-                    save_session(session)
+                    sessions_to_save.append(session)
 
                     file_infos.append(
                         BatchFileInfo(
                             filename=filename,
                             session_id=session_id,
                             status="ready",
-                            chunk_count=len(chunks),
-                            page_count=extract_meta.page_count,
+                            chunk_count=len(session.chunks),
+                            page_count=session.extract_meta.page_count,
                         )
                     )
                     continue
@@ -248,92 +392,39 @@ async def create_batch(
                     )
                     continue
 
-            # Check file size
-            size_mb = len(pdf_bytes) / (1024 * 1024)
-            if size_mb > settings.CHUNKSMITH_MAX_PDF_MB:
-                errors.append(f"{filename}: File too large ({size_mb:.1f}MB)")
+            # Stream the PDF to a bounded buffer, rejecting once over the cap
+            max_bytes = int(settings.CHUNKSMITH_MAX_PDF_MB * 1024 * 1024)
+            pdf_bytes = await _read_upload_bounded(upload_file, head, max_bytes)
+            if pdf_bytes is None:
+                errors.append(f"{filename}: File too large (> {settings.CHUNKSMITH_MAX_PDF_MB}MB)")
                 file_infos.append(
                     BatchFileInfo(
                         filename=filename,
                         session_id=None,
                         status="error",
-                        error=f"File too large ({size_mb:.1f}MB > {settings.CHUNKSMITH_MAX_PDF_MB}MB)",
+                        error=f"File too large (> {settings.CHUNKSMITH_MAX_PDF_MB}MB)",
                     )
                 )
                 continue
 
-            # Create session for this PDF
-            session_id = str(uuid.uuid4())
-            doc_id = filename
-
-            # Extract PDF
-            try:
-                base_pages, extract_meta = extract_pdf_to_pages(
-                    pdf_bytes, settings.PDF_EXTRACTOR_VERSION
-                )
-            except Exception as e:
-                errors.append(f"{filename}: PDF extraction error: {str(e)}")
-                file_infos.append(
-                    BatchFileInfo(
-                        filename=filename,
-                        session_id=None,
-                        status="error",
-                        error=f"PDF extraction error: {str(e)}",
-                    )
-                )
-                continue
-
-            # Default chunk strategy
-            chunk_strategy = ChunkStrategy(
-                chunk_size=settings.DEFAULT_CHUNK_SIZE,
-                overlap=settings.DEFAULT_OVERLAP,
-                split_mode=settings.DEFAULT_SPLIT_MODE,
-                normalize=settings.DEFAULT_NORMALIZE,
-            )
-
-            # Apply normalization if enabled
-            if chunk_strategy.normalize:
-                current_pages = normalize_pages(base_pages)
-            else:
-                current_pages = base_pages.copy()
-
-            # Build full text with page markers
-            current_text = build_text(current_pages)
-
-            # Build page map and chunks
-            page_map = build_page_map(current_text, current_pages, doc_id)
-            chunks = chunk_pages(
-                current_text, page_map, current_pages, chunk_strategy, doc_id
+            # Offload PDF extraction to the process pool; the session is
+            # built once all extractions have been gathered below.
+            file_info = BatchFileInfo(
+                filename=filename,
+                session_id=None,
+                status="pending",
             )
-
-            # Create session
-            session = Session(
-                session_id=session_id,
-                doc_id=doc_id,
-                batch_id=batch_id,  # Link to batch
-                extract_meta=extract_meta,
-                base_pages=base_pages,
-                current_pages=current_pages,
-                current_text=current_text,
-                page_map=page_map,
-                chunk_strategy=chunk_strategy,
-                chunks=chunks,
-                chunk_metadata={},
-                version=1,
-                created_at=now,
-                updated_at=now,
-            )
-
-            # Save session
-            save_session(session)
-
-            file_infos.append(
-                BatchFileInfo(
-                    filename=filename,
-                    session_id=session_id,
-                    status="ready",
-                    chunk_count=len(chunks),
-                    page_count=extract_meta.page_count,
+            file_infos.append(file_info)
+            pending_pdfs.append(
+                (
+                    filename,
+                    file_info,
+                    loop.run_in_executor(
+                        _get_pdf_pool(),
+                        extract_pdf_to_pages,
+                        pdf_bytes,
+                        settings.PDF_EXTRACTOR_VERSION,
+                    ),
                 )
             )
 
@@ -348,6 +439,50 @@ async def create_batch(
                 )
             )
 
+    # Wait for all PDF extractions in parallel, then build sessions
+    if pending_pdfs:
+        results = await asyncio.gather(
+            *(task for _, _, task in pending_pdfs), return_exceptions=True
+        )
+        for (filename, file_info, _), result in zip(pending_pdfs, results):
+            if isinstance(result, BaseException):
+                errors.append(f"{filename}: PDF extraction error: {str(result)}")
+                file_info.status = "error"
+                file_info.error = f"PDF extraction error: {str(result)}"
+                continue
+
+            base_pages, extract_meta = result
+
+            try:
+                # Create session for this PDF; chunking/hashing runs off
+                # the event loop
+                session_id = str(uuid.uuid4())
+                session = await asyncio.to_thread(
+                    _build_pdf_session,
+                    base_pages,
+                    extract_meta,
+                    filename,
+                    session_id,
+                    batch_id,
+                    now,
+                )
+
+                # Queued for the bulk save below
+                sessions_to_save.append(session)
+
+                file_info.session_id = session_id
+                file_info.status = "ready"
+                file_info.chunk_count = len(session.chunks)
+                file_info.page_count = session.extract_meta.page_count
+
+            except Exception as e:
+                errors.append(f"{filename}: {str(e)}")
+                file_info.status = "error"
+                file_info.error = str(e)
+
+    # Flush all sessions with a single directory fsync
+    save_sessions_bulk(sessions_to_save)
+
     # Create batch
     batch = Batch(
         batch_id=batch_id,
@@ -368,18 +503,19 @@ async def get_batches() -> BatchListResponse:
     """
     List all batches.
     """
+    # Index-backed listing is already sorted by created_at descending
     batch_ids = list_batches()
-    batches = []
-
-    for bid in batch_ids:
-        try:
-            batch = load_batch(bid)
-            batches.append(BatchResponse.from_batch(batch))
-        except Exception:
-            pass  # Skip corrupted batches
 
-    # Sort by created_at descending
-    batches.sort(key=lambda b: b.created_at, reverse=True)
+    # Load batch files concurrently so per-file disk latency overlaps
+    results = await asyncio.gather(
+        *(asyncio.to_thread(load_batch, bid) for bid in batch_ids),
+        return_exceptions=True,
+    )
+    batches = [
+        BatchResponse.from_batch(batch)
+        for batch in results
+        if not isinstance(batch, BaseException)  # Skip corrupted batches
+    ]
 
     return BatchListResponse(batches=batches)
 
@@ -391,18 +527,21 @@ async def get_batch(batch_id: str) -> BatchResponse:
     """
     batch = load_batch(batch_id)
 
-    # Update file statuses from sessions
-    for file_info in batch.files:
-        if file_info.session_id:
-            try:
-                session = load_session(file_info.session_id)
-                file_info.chunk_count = len(session.chunks)
-                file_info.page_count = session.extract_meta.page_count
-                # Check if committed (has job completed)
-                # For now, status remains as-is
-            except Exception:
-                file_info.status = "error"
-                file_info.error = "Session not found"
+    # Update file statuses from sessions, loading them concurrently
+    with_sessions = [f for f in batch.files if f.session_id]
+    sessions = await asyncio.gather(
+        *(asyncio.to_thread(load_session, f.session_id) for f in with_sessions),
+        return_exceptions=True,
+    )
+    for file_info, session in zip(with_sessions, sessions):
+        if isinstance(session, BaseException):
+            file_info.status = "error"
+            file_info.error = "Session not found"
+            continue
+        file_info.chunk_count = len(session.chunks)
+        file_info.page_count = session.extract_meta.page_count
+        # Check if committed (has job completed)
+        # For now, status remains as-is
 
     return BatchResponse.from_batch(batch)
 
@@ -427,140 +566,55 @@ async def add_files_to_batch(
     batch = load_batch(batch_id)
     now = datetime.utcnow()
 
+    loop = asyncio.get_running_loop()
+    # (filename, extraction future) per pending PDF
+    pending_pdfs: list[tuple[str, "asyncio.Future"]] = []
+    # Sessions are flushed in one bulk write at the end of the request
+    sessions_to_save: list[Session] = []
+
     for upload_file in files:
         filename = upload_file.filename or f"unknown-{uuid.uuid4()[:8]}.pdf"
 
         try:
-            # Read file content
-            pdf_bytes = await upload_file.read()
+            # Sniff a 4KB header instead of materializing the whole upload
+            head = await upload_file.read(4096)
 
             # Detect JSONL vs PDF and handle per-file
-            if is_probably_jsonl(upload_file.filename, pdf_bytes):
+            if is_probably_jsonl(upload_file.filename, head):
                 try:
                     session_id = str(uuid.uuid4())
                     default_doc_id = upload_file.filename or f"jsonl-{session_id[:8]}"
 
-                    jsonl_chunks, warnings = parse_jsonl(pdf_bytes, default_doc_id)
-
-                    # Group chunks by doc_id to form pages
+                    # Stream-parse the upload line by line; doc_groups is built
+                    # incrementally so the raw file is never held in memory whole
+                    warnings: list[str] = []
                     doc_groups: dict = {}
-                    for jc in jsonl_chunks:
+                    async for jc in parse_jsonl_stream(
+                        aiter_upload_lines(upload_file, head), default_doc_id, warnings
+                    ):
                         doc_key = jc.doc_id or default_doc_id
                         doc_groups.setdefault(doc_key, []).append(jc)
 
-                    base_pages: list[RawPage] = []
-                    chunks: list[ChildChunk] = []
-                    chunk_metadata: dict = {}
-
-                    CHUNK_SEP = "\n\n---\n\n"
-                    current_text_parts: list[str] = []
-                    current_offset = 0
-
-                    page_no = 0
-                    for doc_key, group_chunks in doc_groups.items():
-                        page_no += 1
-                        page_texts = []
-
-                        for idx, jc in enumerate(group_chunks):
-                            chunk_id = jc.chunk_id or f"P{page_no:03d}-C{idx + 1:03d}"
-                            chunk_text = jc.text
-                            char_len = len(chunk_text)
-
-                            start = current_offset
-                            end = start + char_len
-
-                            chunk = ChildChunk(
-                                chunk_id=chunk_id,
-                                page_no=page_no,
-                                start=start,
-                                end=end,
-                                char_len=char_len,
-                                hash=hash_chunk(default_doc_id, chunk_id, chunk_text),
-                                warnings=[],
-                            )
-                            chunks.append(chunk)
-
-                            chunk_metadata[chunk_id] = ChunkMetadata(custom=jc.metadata)
-
-                            page_texts.append(chunk_text)
-                            current_text_parts.append(chunk_text)
-
-                            is_last_chunk = (
-                                doc_key == list(doc_groups.keys())[-1]
-                                and idx == len(group_chunks) - 1
-                            )
-                            if not is_last_chunk:
-                                current_text_parts.append(CHUNK_SEP)
-                                current_offset = end + len(CHUNK_SEP)
-                            else:
-                                current_offset = end
-
-                        page_text = CHUNK_SEP.join(page_texts)
-                        base_pages.append(RawPage(page_no=page_no, text=page_text))
-
-                    current_text = "".join(current_text_parts)
-
-                    # Build page_map
-                    offset = 0
-                    page_map: list[PageSpan] = []
-                    for page in base_pages:
-                        page_len = len(page.text)
-                        page_map.append(
-                            PageSpan(
-                                page_no=page.page_no,
-                                start=offset,
-                                end=offset + page_len,
-                                char_len=page_len,
-                                hash=hash_chunk(default_doc_id, f"page-{page.page_no}", page.text),
-                            )
-                        )
-                        offset += page_len
-                        if page.page_no < len(base_pages):
-                            offset += len(CHUNK_SEP)
-
-                    extract_meta = ExtractMeta(
-                        extractor_name="jsonl_import",
-                        extractor_version="1.0",
-                        page_count=len(base_pages),
-                        warnings=warnings,
-                        created_at=datetime.utcnow(),
-                    )
-
-                    chunk_strategy = ChunkStrategy(
-                        chunk_size=settings.DEFAULT_CHUNK_SIZE,
-                        overlap=0,
-                        split_mode="chars",
-                        normalize=False,
-                    )
-
-                    now = datetime.utcnow()
-                    session = Session(
-                        session_id=session_id,
-                        doc_id=default_doc_id,
-                        batch_id=batch_id,
-                        source_type="jsonl",
-                        extract_meta=extract_meta,
-                        base_pages=base_pages,
-                        current_pages=base_pages.copy(),
-                        current_text=current_text,
-                        page_map=page_map,
-                        chunk_strategy=chunk_strategy,
-                        chunks=chunks,
-                        chunk_metadata=chunk_metadata,
-                        version=1,
-                        created_at=now,
-                        updated_at=now,
+                    # Hashing and assembly are CPU-bound; run off the event loop
+                    session = await asyncio.to_thread(
+                        _build_jsonl_session,
+                        doc_groups,
+                        warnings,
+                        default_doc_id,
+                        session_id,
+                        batch_id,
+                        now,
                     )
 
-                    save_session(session)
+                    sessions_to_save.append(session)
 
                     batch.files.append(
                         BatchFileInfo(
                             filename=filename,
                             session_id=session_id,
                             status="ready",
-                            chunk_count=len(chunks),
-                            page_count=extract_meta.page_count,
+                            chunk_count=len(session.chunks),
+                            page_count=session.extract_meta.page_count,
                         )
                     )
                     continue
@@ -575,38 +629,33 @@ async def add_files_to_batch(
                     )
                     continue
 
-            # Check file size
-            size_mb = len(pdf_bytes) / (1024 * 1024)
-            if size_mb > settings.CHUNKSMITH_MAX_PDF_MB:
+            # Stream the PDF to a bounded buffer, rejecting once over the cap
+            max_bytes = int(settings.CHUNKSMITH_MAX_PDF_MB * 1024 * 1024)
+            pdf_bytes = await _read_upload_bounded(upload_file, head, max_bytes)
+            if pdf_bytes is None:
                 batch.files.append(
                     BatchFileInfo(
                         filename=filename,
                         session_id=None,
                         status="error",
-                        error=f"File too large ({size_mb:.1f}MB > {settings.CHUNKSMITH_MAX_PDF_MB}MB)",
+                        error=f"File too large (> {settings.CHUNKSMITH_MAX_PDF_MB}MB)",
                     )
                 )
                 continue
 
-            # Create session for this PDF
-            session_id = str(uuid.uuid4())
-            doc_id = filename
-
-            # Extract PDF
-            try:
-                base_pages, extract_meta = extract_pdf_to_pages(
-                    pdf_bytes, settings.PDF_EXTRACTOR_VERSION
+            # Offload PDF extraction to the process pool; results are
+            # gathered below so files extract in parallel.
+            pending_pdfs.append(
+                (
+                    filename,
+                    loop.run_in_executor(
+                        _get_pdf_pool(),
+                        extract_pdf_to_pages,
+                        pdf_bytes,
+                        settings.PDF_EXTRACTOR_VERSION,
+                    ),
                 )
-            except Exception as e:
-                batch.files.append(
-                    BatchFileInfo(
-                        filename=filename,
-                        session_id=None,
-                        status="error",
-                        error=f"PDF extraction error: {str(e)}",
-                    )
-                )
-                continue
+            )
 
         except Exception as e:
             batch.files.append(
@@ -618,6 +667,25 @@ async def add_files_to_batch(
                 )
             )
 
+    # Wait for all PDF extractions in parallel
+    if pending_pdfs:
+        results = await asyncio.gather(
+            *(task for _, task in pending_pdfs), return_exceptions=True
+        )
+        for (filename, _), result in zip(pending_pdfs, results):
+            if isinstance(result, BaseException):
+                batch.files.append(
+                    BatchFileInfo(
+                        filename=filename,
+                        session_id=None,
+                        status="error",
+                        error=f"PDF extraction error: {str(result)}",
+                    )
+                )
+
+    # Flush all sessions with a single directory fsync
+    save_sessions_bulk(sessions_to_save)
+
     # Update batch
     batch.updated_at = now
     save_batch(batch)
@@ -658,13 +726,8 @@ async def commit_batch(batch_id: str, request: BatchCommitRequest) -> BatchCommi
             )
             save_job(job)
 
-            # Start job in background thread
-            thread = threading.Thread(
-                target=run_commit_job,
-                args=(job,),
-                daemon=True,
-            )
-            thread.start()
+            # Queue job on the shared commit pool
+            submit_commit_job(job)
 
             job_ids.append(job_id)
             job_session_map[job_id] = session.session_id
@@ -26,7 +26,7 @@ async def get_chunk_detail(session_id: str, chunk_id: str) -> ChunkDetailRespons
     session = load_session(session_id)
 
     # Find chunk
-    chunk = next((c for c in session.chunks if c.chunk_id == chunk_id), None)
+    chunk = session.get_chunk(chunk_id)
     if chunk is None:
         raise ChunkNotFoundError(session_id, chunk_id)
 
@@ -67,7 +67,7 @@ async def update_chunk_metadata(
     session = load_session(session_id)
 
     # Verify chunk exists
-    chunk = next((c for c in session.chunks if c.chunk_id == chunk_id), None)
+    chunk = session.get_chunk(chunk_id)
     if chunk is None:
         raise ChunkNotFoundError(session_id, chunk_id)
 
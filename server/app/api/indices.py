@@ -3,7 +3,8 @@ ChunkSmith Hybrid - Indices API
 OpenSearch index management
 """
 
-from typing import Optional
+import time
+from typing import Dict, Optional, Tuple
 
 from fastapi import APIRouter
 
@@ -13,34 +14,73 @@ from ..integrations.opensearch_client import get_opensearch_client
 
 router = APIRouter(prefix="/api/indices", tags=["indices"])
 
+# Vector dimension per index, cached for a short TTL: mappings are fixed at
+# index creation, so re-fetching them on every listing is a wasted RPC.
+_MAPPING_CACHE: Dict[str, Tuple[float, Optional[int]]] = {}
+_MAPPING_CACHE_TTL = 60.0
 
-def _parse_size(size_str: str) -> int:
-    """Parse size string (e.g., '1.2mb', '500kb') to bytes."""
-    size_str = size_str.lower().strip()
-    multipliers = {
-        "b": 1,
-        "kb": 1024,
-        "mb": 1024 * 1024,
-        "gb": 1024 * 1024 * 1024,
-        "tb": 1024 * 1024 * 1024 * 1024,
-    }
+# Debounce the doc-count refresh: a cluster-wide refresh per UI poll adds
+# latency and write amplification for no real accuracy gain.
+_last_refresh_ts = 0.0
+_REFRESH_DEBOUNCE_S = 5.0
 
-    for suffix, mult in multipliers.items():
-        if size_str.endswith(suffix):
-            try:
-                return int(float(size_str[: -len(suffix)]) * mult)
-            except ValueError:
-                return 0
-    return 0
+
+def _get_vector_dim_cached(client, index_name: str) -> Optional[int]:
+    """Get the vector dimension of an index, served from a TTL cache."""
+    now = time.monotonic()
+    entry = _MAPPING_CACHE.get(index_name)
+    if entry is not None and now - entry[0] < _MAPPING_CACHE_TTL:
+        return entry[1]
+
+    dimension: Optional[int] = None
+    try:
+        mapping = client.get_mapping(index_name)
+        if index_name in mapping:
+            props = mapping[index_name].get("mappings", {}).get("properties", {})
+            if "vector" in props:
+                dimension = props["vector"].get("dimension")
+    except Exception:
+        # Leave any stale entry in place; a transient mapping failure
+        # shouldn't blank out a known dimension.
+        return entry[1] if entry is not None else None
+
+    _MAPPING_CACHE[index_name] = (now, dimension)
+    return dimension
+
+
+def _get_vector_dims_bulk(client, index_pattern: str) -> Dict[str, Optional[int]]:
+    """
+    Fetch vector dimensions for all indices matching a pattern in one RPC.
+
+    Uses filter_path so the response carries only the dimension fields,
+    and refreshes the TTL cache as a side effect.
+    """
+    try:
+        mappings = client._client.indices.get_mapping(
+            index=index_pattern,
+            filter_path="*.mappings.properties.vector.dimension",
+        )
+    except Exception:
+        return {}
+
+    now = time.monotonic()
+    dims: Dict[str, Optional[int]] = {}
+    for index_name, body in mappings.items():
+        props = body.get("mappings", {}).get("properties", {})
+        dimension = props.get("vector", {}).get("dimension")
+        dims[index_name] = dimension
+        _MAPPING_CACHE[index_name] = (now, dimension)
+    return dims
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
 
 
 def _format_size(size_bytes: int) -> str:
     """Format bytes to human-readable string."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    # Pick the unit from the bit length (one divide, no loop)
+    i = min(max(size_bytes.bit_length() - 1, 0) // 10, 5)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
 @router.get("", response_model=IndexListResponse)
@@ -57,14 +97,28 @@ async def list_indices() -> IndexListResponse:
     client = get_opensearch_client()
 
     try:
-        # Refresh all chunksmith indices to get accurate doc counts
-        try:
-            client._client.indices.refresh(index="chunksmith-*")
-        except Exception:
-            pass  # Ignore if no indices exist yet
+        # Refresh chunksmith indices to get accurate doc counts, at most
+        # once per debounce window
+        global _last_refresh_ts
+        now = time.monotonic()
+        if now - _last_refresh_ts >= _REFRESH_DEBOUNCE_S:
+            _last_refresh_ts = now
+            try:
+                client._client.indices.refresh(index="chunksmith-*")
+            except Exception:
+                pass  # Ignore if no indices exist yet
+
+        # Get all indices with stats; bytes="b" returns raw byte counts so
+        # no size-string parsing is needed, and h= trims the response to
+        # just the columns we read
+        indices_response = client._client.cat.indices(
+            format="json",
+            h="index,docs.count,store.size,health,status",
+            bytes="b",
+        )
 
-        # Get all indices with stats
-        indices_response = client._client.cat.indices(format="json")
+        # One wildcard mapping call for every index instead of one RPC each
+        dim_by_index = _get_vector_dims_bulk(client, "*")
 
         indices = []
         for idx in indices_response:
@@ -74,19 +128,7 @@ async def list_indices() -> IndexListResponse:
             if index_name.startswith("."):
                 continue
 
-            # Get dimension from mapping if it's a vector index
-            dimension: Optional[int] = None
-            try:
-                mapping = client.get_mapping(index_name)
-                if index_name in mapping:
-                    props = mapping[index_name].get("mappings", {}).get("properties", {})
-                    if "vector" in props:
-                        dimension = props["vector"].get("dimension")
-            except Exception:
-                pass
-
-            size_str = idx.get("store.size", "0b")
-            size_bytes = _parse_size(size_str)
+            size_bytes = int(idx.get("store.size") or 0)
 
             indices.append(
                 IndexInfo(
@@ -94,7 +136,7 @@ async def list_indices() -> IndexListResponse:
                     doc_count=int(idx.get("docs.count", 0) or 0),
                     size_bytes=size_bytes,
                     size_human=_format_size(size_bytes),
-                    dimension=dimension,
+                    dimension=dim_by_index.get(index_name),
                     health=idx.get("health", "unknown"),
                     status=idx.get("status", "unknown"),
                 )
@@ -121,26 +163,22 @@ async def get_index(index_name: str) -> IndexInfo:
         if not client.index_exists(index_name):
             raise IndexNotFoundError(index_name)
 
-        # Get index stats
-        stats = client._client.cat.indices(index=index_name, format="json")
+        # Get index stats (bytes="b" for raw byte counts)
+        stats = client._client.cat.indices(
+            index=index_name,
+            format="json",
+            h="index,docs.count,store.size,health,status",
+            bytes="b",
+        )
         if not stats:
             raise IndexNotFoundError(index_name)
 
         idx = stats[0]
 
         # Get dimension from mapping
-        dimension: Optional[int] = None
-        try:
-            mapping = client.get_mapping(index_name)
-            if index_name in mapping:
-                props = mapping[index_name].get("mappings", {}).get("properties", {})
-                if "vector" in props:
-                    dimension = props["vector"].get("dimension")
-        except Exception:
-            pass
-
-        size_str = idx.get("store.size", "0b")
-        size_bytes = _parse_size(size_str)
+        dimension = _get_vector_dim_cached(client, index_name)
+
+        size_bytes = int(idx.get("store.size") or 0)
 
         return IndexInfo(
             index_name=index_name,
@@ -178,6 +216,7 @@ async def delete_index(index_name: str) -> IndexDeleteResponse:
 
         # Delete the index
         client.delete_index(index_name)
+        _MAPPING_CACHE.pop(index_name, None)
 
         return IndexDeleteResponse(
             index_name=index_name,
@@ -3,21 +3,114 @@ ChunkSmith Hybrid - Search API
 Text, vector, and hybrid search across indexed chunks
 """
 
+import base64
+import hashlib
 import time
-from typing import Any, Dict, List
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+
+import orjson
+from typing import Any, Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException
 
 from ..core.models import SearchHit, SearchRequest, SearchResponse
 from ..core.runtime_state import get_embedding_models
 from ..core.search_builders import build_hybrid_query, build_knn_query, build_text_query
-from ..integrations.embeddings import get_embedding_provider
+from ..integrations.embeddings import DynamicBatcher
 from ..integrations.opensearch_client import get_opensearch_client
-from ..integrations.opensearch_index_manager import get_default_index_name
+from ..integrations.opensearch_index_manager import (
+    get_default_index_name,
+    sanitize_model_key,
+)
 
 router = APIRouter(prefix="/api", tags=["search"])
 
 
+@lru_cache(maxsize=4)
+def _sanitized_model_map(models: Tuple[str, ...]) -> Dict[str, str]:
+    """Map sanitized model keys back to their original model names."""
+    return {sanitize_model_key(m): m for m in models}
+
+
+# Coalesces concurrent query-embedding calls into one provider batch
+_query_batcher = DynamicBatcher()
+
+# LRU cache of query embeddings: repeated identical queries (refreshes,
+# dashboards) skip the embedding call entirely
+_EMB_CACHE: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+_EMB_CACHE_MAX = 4096
+
+
+async def _embed_query_cached(model: str, query: str) -> List[float]:
+    """Embed a query via the batcher, memoized by (model, query)."""
+    key = (model, query)
+    cached = _EMB_CACHE.get(key)
+    if cached is not None:
+        _EMB_CACHE.move_to_end(key)
+        return cached
+
+    vector = await _query_batcher.embed(model, query)
+    _EMB_CACHE[key] = vector
+    if len(_EMB_CACHE) > _EMB_CACHE_MAX:
+        _EMB_CACHE.popitem(last=False)
+    return vector
+
+
+# Short-TTL cache of raw OpenSearch responses for idempotent queries
+_SEARCH_CACHE: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_SEARCH_CACHE_MAX = 1024
+_SEARCH_CACHE_TTL = 30.0
+
+
+def _search_cache_key(index_name: str, query_body: Dict[str, Any]) -> str:
+    """Canonical SHA256 key over (index, query body)."""
+    payload = orjson.dumps(
+        {"index": index_name, "body": query_body}, option=orjson.OPT_SORT_KEYS
+    )
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _search_cached(client, index_name: str, query_body: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute a search, serving repeats from the TTL cache."""
+    key = _search_cache_key(index_name, query_body)
+    now = time.monotonic()
+    entry = _SEARCH_CACHE.get(key)
+    if entry is not None and now - entry[0] < _SEARCH_CACHE_TTL:
+        _SEARCH_CACHE.move_to_end(key)
+        return entry[1]
+
+    response = client.search(index_name, query_body)
+    _SEARCH_CACHE[key] = (now, response)
+    if len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX:
+        _SEARCH_CACHE.popitem(last=False)
+    return response
+
+
+def _request_vector(request: SearchRequest) -> Optional[List[float]]:
+    """
+    Return the caller-supplied vector as a list of numbers, if any.
+
+    Accepts either the float list or, with vector_encoding=int8_b64, a
+    base64 string packing one signed byte per dimension — the compact
+    wire form for byte-quantized indices, decoded here in one C-level
+    array copy instead of validating hundreds of floats.
+    """
+    vec = request.vector
+    if vec is None or not isinstance(vec, str):
+        return vec
+
+    if request.vector_encoding != "int8_b64":
+        raise HTTPException(
+            400, "String vector requires vector_encoding=int8_b64"
+        )
+    try:
+        return array("b", base64.b64decode(vec, validate=True)).tolist()
+    except ValueError as e:
+        raise HTTPException(400, f"Invalid int8_b64 vector: {e}")
+
+
 def _extract_hits(raw_hits: List[Dict[str, Any]]) -> List[SearchHit]:
     """
     Extract SearchHit objects from OpenSearch response.
@@ -32,12 +125,19 @@ def _extract_hits(raw_hits: List[Dict[str, Any]]) -> List[SearchHit]:
     for rank, hit in enumerate(raw_hits, start=1):
         source = hit.get("_source", {})
 
-        # Get text snippet (first 200 chars)
-        text = source.get("text", "")
-        text_snippet = text[:200] + "..." if len(text) > 200 else text
+        # Snippet comes from the server-side highlight (queries exclude the
+        # full text from _source); fall back to slicing for older indices
+        highlight = hit.get("highlight", {}).get("text")
+        if highlight:
+            text_snippet = highlight[0]
+        else:
+            text = source.get("text", "")
+            text_snippet = text[:200] + ("..." if len(text) > 200 else "")
 
+        # model_construct skips per-field validation; the OpenSearch
+        # response carries values we indexed ourselves
         hits.append(
-            SearchHit(
+            SearchHit.model_construct(
                 rank=rank,
                 score=hit.get("_score", 0.0),
                 doc_id=source.get("doc_id", ""),
@@ -55,15 +155,16 @@ def _extract_hits(raw_hits: List[Dict[str, Any]]) -> List[SearchHit]:
     return hits
 
 
+@lru_cache(maxsize=256)
 def extract_model_from_index_name(index_name: str) -> str:
     """
     Extract model key from index name.
-    
+
     Index format: chunksmith-chunks__<model_key>
     """
-    if "__" in index_name:
-        return index_name.split("__", 1)[1]
-    return index_name
+    # partition scans once; memoized since the same few names recur
+    head, sep, tail = index_name.partition("__")
+    return tail if sep else head
 
 
 @router.post("/search", response_model=SearchResponse)
@@ -85,22 +186,25 @@ async def search_chunks(request: SearchRequest) -> SearchResponse:
     # Determine index_name and embedding_model
     index_name = request.index_name
     embedding_model = request.embedding_model
-    
+    supplied_vector = _request_vector(request)
+
+    # The embedding model is only needed when we have to embed the query
+    # ourselves; a caller-supplied vector (or plain text mode) skips it
+    needs_model = request.vector is None and request.mode in ("vector", "hybrid")
+
     if index_name:
-        # When index_name is specified, derive model from it
-        # The model key in index may be sanitized, but we need it for embedding provider
-        # We'll use the model_key directly for embedding (provider handles mapping)
-        model_key = extract_model_from_index_name(index_name)
-        # Try to find matching model from available models
-        available = get_embedding_models()
-        for m in available:
-            from ..integrations.opensearch_index_manager import sanitize_model_key
-            if sanitize_model_key(m) == model_key:
-                embedding_model = m
-                break
-        if not embedding_model:
-            # Fallback: use the model_key as-is (may work for simple names)
-            embedding_model = model_key
+        if needs_model:
+            # When index_name is specified, derive model from it
+            # The model key in index may be sanitized, but we need it for embedding provider
+            # We'll use the model_key directly for embedding (provider handles mapping)
+            model_key = extract_model_from_index_name(index_name)
+            # Look up the original model via the memoized reverse map
+            matched = _sanitized_model_map(tuple(get_embedding_models())).get(model_key)
+            if matched:
+                embedding_model = matched
+            if not embedding_model:
+                # Fallback: use the model_key as-is (may work for simple names)
+                embedding_model = model_key
     else:
         # Legacy behavior: determine model and index
         if not embedding_model and request.mode in ("vector", "hybrid"):
@@ -125,13 +229,11 @@ async def search_chunks(request: SearchRequest) -> SearchResponse:
             filters=request.filters,
         )
     elif request.mode == "vector":
-        # Get or generate vector
-        if request.vector:
-            vector = request.vector
+        # Get or generate vector (cached, batched across concurrent requests)
+        if supplied_vector:
+            vector = supplied_vector
         else:
-            provider = get_embedding_provider(embedding_model)
-            vectors = provider.embed_texts([request.query])
-            vector = vectors[0] if vectors else []
+            vector = await _embed_query_cached(embedding_model, request.query)
 
         query_body = build_knn_query(
             vector=vector,
@@ -139,13 +241,11 @@ async def search_chunks(request: SearchRequest) -> SearchResponse:
             filters=request.filters,
         )
     else:  # hybrid
-        # Generate vector
-        if request.vector:
-            vector = request.vector
+        # Generate vector (cached, batched across concurrent requests)
+        if supplied_vector:
+            vector = supplied_vector
         else:
-            provider = get_embedding_provider(embedding_model)
-            vectors = provider.embed_texts([request.query])
-            vector = vectors[0] if vectors else []
+            vector = await _embed_query_cached(embedding_model, request.query)
 
         query_body = build_hybrid_query(
             query=request.query,
@@ -154,9 +254,12 @@ async def search_chunks(request: SearchRequest) -> SearchResponse:
             filters=request.filters,
         )
 
-    # Execute search
+    # Execute search (short-TTL response cache unless bypassed)
     client = get_opensearch_client()
-    response = client.search(index_name, query_body)
+    if request.no_cache:
+        response = client.search(index_name, query_body)
+    else:
+        response = _search_cached(client, index_name, query_body)
 
     # Extract results
     raw_hits = response.get("hits", {}).get("hits", [])
@@ -3,27 +3,20 @@ ChunkSmith Hybrid - Sessions API
 Create, read, update sessions and commit to OpenSearch
 """
 
-import threading
+import asyncio
 import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, File, Form, UploadFile
 
+from .batches import _build_jsonl_session, _build_pdf_session, _get_pdf_pool
 from ..core.chunking import build_page_map, chunk_pages
 from ..core.config import settings
 from ..core.errors import PDFTooLargeError, VersionConflictError
-from ..core.hashing import hash_chunk
 from ..core.models import (
-    ChildChunk,
-    ChunkMetadata,
-    ChunkStrategy,
     CommitRequest,
     CommitResponse,
-    ExtractMeta,
-    PageSpan,
-    RawPage,
-    Session,
     SessionResponse,
     UpdateChunkStrategyRequest,
     UpdateChunkStrategyResponse,
@@ -32,15 +25,47 @@ from ..core.models import (
 )
 from ..core.normalize import normalize_pages
 from ..core.page_marker import build_text, parse_text
-from ..core.storage import load_session, save_session
+from ..core.storage import load_session, load_session_version, save_session
 from ..integrations.pdf_extractor import extract_pdf_to_pages
-from ..integrations.jsonl_parser import parse_jsonl, validate_jsonl_preview, JSONLParseError
-from ..jobs import create_job, run_commit_job
+from ..integrations.jsonl_parser import (
+    JSONLParseError,
+    aiter_upload_lines,
+    parse_jsonl_stream,
+    validate_jsonl_preview_stream,
+)
+from ..jobs import create_job, submit_commit_job
 from ..core.storage import save_job
 
 router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 
 
+def _recompute_from_pages(current_pages, chunk_strategy, doc_id):
+    """Rebuild text, page map and chunks for a set of pages (CPU-bound)."""
+    current_text = build_text(current_pages)
+    page_map = build_page_map(current_text, current_pages, doc_id)
+    chunks = chunk_pages(current_text, page_map, current_pages, chunk_strategy, doc_id)
+    return current_text, page_map, chunks
+
+
+def _reparse_and_chunk(text, page_count, chunk_strategy, doc_id):
+    """Parse edited text back into pages and recompute derived state."""
+    current_pages = parse_text(text, page_count)
+    if chunk_strategy.normalize:
+        current_pages = normalize_pages(current_pages)
+    return (current_pages, *_recompute_from_pages(current_pages, chunk_strategy, doc_id))
+
+
+def _apply_strategy(base_pages, chunk_strategy, doc_id):
+    """Re-derive pages from base pages under a new strategy and recompute."""
+    if chunk_strategy.normalize:
+        current_pages = normalize_pages(base_pages)
+    else:
+        # Fresh list, shared RawPage objects: nothing downstream mutates
+        # pages, so copying every page's text is wasted work
+        current_pages = list(base_pages)
+    return (current_pages, *_recompute_from_pages(current_pages, chunk_strategy, doc_id))
+
+
 @router.post("", response_model=SessionResponse)
 async def create_session(
     file: UploadFile = File(...),
@@ -66,48 +91,20 @@ async def create_session(
     if not doc_id:
         doc_id = file.filename or f"doc-{session_id[:8]}"
 
-    # Extract PDF
-    base_pages, extract_meta = extract_pdf_to_pages(
-        pdf_bytes, settings.PDF_EXTRACTOR_VERSION
+    # Extract PDF in the process pool, then assemble the session in a
+    # worker thread; neither step blocks the event loop
+    loop = asyncio.get_running_loop()
+    base_pages, extract_meta = await loop.run_in_executor(
+        _get_pdf_pool(), extract_pdf_to_pages, pdf_bytes, settings.PDF_EXTRACTOR_VERSION
     )
-
-    # Default chunk strategy
-    chunk_strategy = ChunkStrategy(
-        chunk_size=settings.DEFAULT_CHUNK_SIZE,
-        overlap=settings.DEFAULT_OVERLAP,
-        split_mode=settings.DEFAULT_SPLIT_MODE,
-        normalize=settings.DEFAULT_NORMALIZE,
-    )
-
-    # Apply normalization if enabled
-    if chunk_strategy.normalize:
-        current_pages = normalize_pages(base_pages)
-    else:
-        current_pages = base_pages.copy()
-
-    # Build full text with page markers
-    current_text = build_text(current_pages)
-
-    # Build page map and chunks
-    page_map = build_page_map(current_text, current_pages, doc_id)
-    chunks = chunk_pages(current_text, page_map, current_pages, chunk_strategy, doc_id)
-
-    # Create session
-    now = datetime.utcnow()
-    session = Session(
-        session_id=session_id,
-        doc_id=doc_id,
-        extract_meta=extract_meta,
-        base_pages=base_pages,
-        current_pages=current_pages,
-        current_text=current_text,
-        page_map=page_map,
-        chunk_strategy=chunk_strategy,
-        chunks=chunks,
-        chunk_metadata={},
-        version=1,
-        created_at=now,
-        updated_at=now,
+    session = await asyncio.to_thread(
+        _build_pdf_session,
+        base_pages,
+        extract_meta,
+        doc_id,
+        session_id,
+        None,  # no batch
+        datetime.utcnow(),
     )
 
     # Save session
@@ -117,14 +114,20 @@ async def create_session(
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
-async def get_session(session_id: str) -> SessionResponse:
+async def get_session(
+    session_id: str,
+    chunks_offset: int = 0,
+    chunks_limit: Optional[int] = None,
+) -> SessionResponse:
     """
     Get session by ID.
 
     Returns full session state including current text, page map, and chunks.
+    chunks_offset/chunks_limit page through the chunk list (chunks_total
+    reports the full count); by default the whole list is returned.
     """
     session = load_session(session_id)
-    return SessionResponse.from_session(session)
+    return SessionResponse.from_session(session, chunks_offset, chunks_limit)
 
 
 @router.put("/{session_id}/text", response_model=UpdateTextResponse)
@@ -138,26 +141,20 @@ async def update_text(session_id: str, request: UpdateTextRequest) -> UpdateText
     - Recalculates page map and chunks
     - Increments version (optimistic locking)
     """
-    session = load_session(session_id)
-
-    # Check version
-    if request.version != session.version:
-        raise VersionConflictError(request.version, session.version)
-
-    # Parse pages from new text
-    current_pages = parse_text(request.current_text, session.extract_meta.page_count)
+    # Fast-reject stale versions before loading the full session
+    current_version = load_session_version(session_id)
+    if request.version != current_version:
+        raise VersionConflictError(request.version, current_version)
 
-    # Apply normalization if enabled
-    if session.chunk_strategy.normalize:
-        current_pages = normalize_pages(current_pages)
-
-    # Rebuild text (normalized)
-    current_text = build_text(current_pages)
+    session = load_session(session_id)
 
-    # Recalculate page map and chunks
-    page_map = build_page_map(current_text, current_pages, session.doc_id)
-    chunks = chunk_pages(
-        current_text, page_map, current_pages, session.chunk_strategy, session.doc_id
+    # Re-parse pages and recompute derived state off the event loop
+    current_pages, current_text, page_map, chunks = await asyncio.to_thread(
+        _reparse_and_chunk,
+        request.current_text,
+        session.extract_meta.page_count,
+        session.chunk_strategy,
+        session.doc_id,
     )
 
     # Update session
@@ -190,28 +187,22 @@ async def update_chunk_strategy(
     - Recalculates page map and chunks with new strategy
     - Increments version (optimistic locking)
     """
-    session = load_session(session_id)
+    # Fast-reject stale versions before loading the full session
+    current_version = load_session_version(session_id)
+    if request.version != current_version:
+        raise VersionConflictError(request.version, current_version)
 
-    # Check version
-    if request.version != session.version:
-        raise VersionConflictError(request.version, session.version)
+    session = load_session(session_id)
 
     # Update strategy
     session.chunk_strategy = request.chunk_strategy
 
-    # Re-normalize if setting changed
-    if request.chunk_strategy.normalize:
-        current_pages = normalize_pages(session.base_pages)
-    else:
-        current_pages = [p.model_copy() for p in session.base_pages]
-
-    # Rebuild text
-    current_text = build_text(current_pages)
-
-    # Recalculate page map and chunks
-    page_map = build_page_map(current_text, current_pages, session.doc_id)
-    chunks = chunk_pages(
-        current_text, page_map, current_pages, request.chunk_strategy, session.doc_id
+    # Re-derive pages under the new strategy and recompute off the event loop
+    current_pages, current_text, page_map, chunks = await asyncio.to_thread(
+        _apply_strategy,
+        session.base_pages,
+        request.chunk_strategy,
+        session.doc_id,
     )
 
     # Update session
@@ -261,9 +252,8 @@ async def commit_session(session_id: str, request: CommitRequest) -> CommitRespo
     # Save initial job state
     save_job(job)
 
-    # Start background thread
-    thread = threading.Thread(target=run_commit_job, args=(job,), daemon=True)
-    thread.start()
+    # Queue on the bounded commit pool (COMMIT_WORKERS threads)
+    submit_commit_job(job)
 
     return CommitResponse(job_id=job_id)
 
@@ -271,6 +261,22 @@ async def commit_session(session_id: str, request: CommitRequest) -> CommitRespo
 # ==================== JSONL Import ====================
 
 
+async def _aiter_jsonl_lines_limited(file: UploadFile, limit_mb: int):
+    """
+    Yield JSONL lines from an upload, enforcing the size limit incrementally.
+
+    Rejects oversized uploads as soon as the limit is crossed instead of
+    buffering the whole file first.
+    """
+    limit_bytes = limit_mb * 1024 * 1024
+    read_bytes = 0
+    async for line in aiter_upload_lines(file):
+        read_bytes += len(line) + 1
+        if read_bytes > limit_bytes:
+            raise PDFTooLargeError(read_bytes / (1024 * 1024), limit_mb)
+        yield line
+
+
 @router.post("/jsonl/preview")
 async def preview_jsonl(
     file: UploadFile = File(...),
@@ -281,11 +287,13 @@ async def preview_jsonl(
 
     Returns validation result and sample chunks.
     """
-    content = await file.read()
     default_doc_id = doc_id or file.filename or "imported"
 
     try:
-        return validate_jsonl_preview(content, default_doc_id)
+        return await validate_jsonl_preview_stream(
+            _aiter_jsonl_lines_limited(file, settings.CHUNKSMITH_MAX_PDF_MB),
+            default_doc_id,
+        )
     except JSONLParseError as e:
         return {
             "error": str(e),
@@ -310,138 +318,31 @@ async def create_jsonl_session(
     JSONL format:
     {"text": "chunk content", "doc_id": "optional", "chunk_id": "optional", "metadata": {...}}
     """
-    content = await file.read()
-
-    # Check file size (use same limit as PDF)
-    size_mb = len(content) / (1024 * 1024)
-    if size_mb > settings.CHUNKSMITH_MAX_PDF_MB:
-        raise PDFTooLargeError(size_mb, settings.CHUNKSMITH_MAX_PDF_MB)
-
     # Generate IDs
     session_id = str(uuid.uuid4())
     default_doc_id = doc_id or file.filename or f"jsonl-{session_id[:8]}"
 
-    # Parse JSONL
-    jsonl_chunks, warnings = parse_jsonl(content, default_doc_id)
-
-    # Group chunks by doc_id for "pages"
+    # Stream-parse the upload line by line (size limit enforced as bytes
+    # arrive), grouping chunks by doc_id for "pages" as they are yielded
+    warnings: list[str] = []
     doc_groups: Dict[str, list] = {}
-    for jc in jsonl_chunks:
-        doc_key = jc.doc_id or default_doc_id
-        if doc_key not in doc_groups:
-            doc_groups[doc_key] = []
-        doc_groups[doc_key].append(jc)
-
-    # Build pages (one per doc_id group)
-    base_pages: list[RawPage] = []
-    chunks: list[ChildChunk] = []
-    chunk_metadata: Dict[str, ChunkMetadata] = {}
-
-    # Chunk separator for display
-    CHUNK_SEP = "\n\n---\n\n"
-    current_text_parts: list[str] = []
-    current_offset = 0
-    page_map: list[PageSpan] = []
-
-    page_no = 0
-    for doc_key, group_chunks in doc_groups.items():
-        page_no += 1
-        page_texts = []
-
-        for idx, jc in enumerate(group_chunks):
-            chunk_id = jc.chunk_id or f"P{page_no:03d}-C{idx + 1:03d}"
-            chunk_text = jc.text
-            char_len = len(chunk_text)
-
-            # Calculate positions
-            start = current_offset
-            end = start + char_len
-
-            # Create chunk
-            chunk = ChildChunk(
-                chunk_id=chunk_id,
-                page_no=page_no,
-                start=start,
-                end=end,
-                char_len=char_len,
-                hash=hash_chunk(default_doc_id, chunk_id, chunk_text),
-                warnings=[],
-            )
-            chunks.append(chunk)
-
-            # Store metadata (including custom fields from JSONL)
-            chunk_metadata[chunk_id] = ChunkMetadata(custom=jc.metadata)
-
-            page_texts.append(chunk_text)
-            current_text_parts.append(chunk_text)
-
-            # Add separator (except for last chunk of last page)
-            is_last_chunk = (doc_key == list(doc_groups.keys())[-1] and 
-                           idx == len(group_chunks) - 1)
-            if not is_last_chunk:
-                current_text_parts.append(CHUNK_SEP)
-                current_offset = end + len(CHUNK_SEP)
-            else:
-                current_offset = end
-
-        # Create page
-        page_text = CHUNK_SEP.join(page_texts)
-        base_pages.append(RawPage(page_no=page_no, text=page_text))
-
-    # Build current_text
-    current_text = "".join(current_text_parts)
-
-    # Rebuild page_map with correct offsets
-    offset = 0
-    page_map = []
-    for page in base_pages:
-        page_len = len(page.text)
-        page_map.append(PageSpan(
-            page_no=page.page_no,
-            start=offset,
-            end=offset + page_len,
-            char_len=page_len,
-            hash=hash_chunk(default_doc_id, f"page-{page.page_no}", page.text),
-        ))
-        # Account for separator
-        offset += page_len
-        if page.page_no < len(base_pages):
-            offset += len(CHUNK_SEP)
-
-    # Create extract metadata
-    extract_meta = ExtractMeta(
-        extractor_name="jsonl_import",
-        extractor_version="1.0",
-        page_count=len(base_pages),
-        warnings=warnings,
-        created_at=datetime.utcnow(),
-    )
-
-    # Chunk strategy (read-only for JSONL, chunks are pre-defined)
-    chunk_strategy = ChunkStrategy(
-        chunk_size=settings.DEFAULT_CHUNK_SIZE,  # Use default to satisfy validation
-        overlap=0,
-        split_mode="chars",
-        normalize=False,
-    )
-
-    # Create session
-    now = datetime.utcnow()
-    session = Session(
-        session_id=session_id,
-        doc_id=default_doc_id,
-        source_type="jsonl",
-        extract_meta=extract_meta,
-        base_pages=base_pages,
-        current_pages=base_pages.copy(),
-        current_text=current_text,
-        page_map=page_map,
-        chunk_strategy=chunk_strategy,
-        chunks=chunks,
-        chunk_metadata=chunk_metadata,
-        version=1,
-        created_at=now,
-        updated_at=now,
+    async for jc in parse_jsonl_stream(
+        _aiter_jsonl_lines_limited(file, settings.CHUNKSMITH_MAX_PDF_MB),
+        default_doc_id,
+        warnings,
+    ):
+        doc_groups.setdefault(jc.doc_id or default_doc_id, []).append(jc)
+
+    # Assemble the session in one linear pass with batched hashing,
+    # off the event loop (shared with the batch upload path)
+    session = await asyncio.to_thread(
+        _build_jsonl_session,
+        doc_groups,
+        warnings,
+        default_doc_id,
+        session_id,
+        None,  # no batch
+        datetime.utcnow(),
     )
 
     # Save session
@@ -3,13 +3,72 @@ ChunkSmith Hybrid - Chunking Logic
 Build page_map (blue boundaries) and chunks (red boundaries)
 """
 
+import bisect
+import os
 import re
-from typing import List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Optional, Tuple
 
-from .hashing import hash_chunk, hash_page
+from .hashing import hash_chunks_batch, hash_page
 from .models import ChildChunk, ChunkStrategy, PageSpan, RawPage
 from .page_marker import PAGE_MARKER_PATTERN, get_page_marker_positions
 
+# Compiled once at import. Newline ends double as paragraph boundaries
+# (every \n\n+ end is also a \n end, so one pattern covers both).
+_NL_RE = re.compile(r"\n")
+
+# All heading shapes in one alternation, with the heading content in a
+# lookahead so a match consumes at most the leading newline and can't
+# swallow the start of an adjacent heading. The all-caps class uses
+# [A-Z ] (space only, not \s) so it can't cross newlines and backtrack
+# quadratically on space-heavy caps runs.
+_HEADING_START_RE = re.compile(
+    r"(?:^|\n)(?="
+    r"\d+(?:\.\d+)*\.?\s"  # numbered: "1.", "1.1", ...
+    r"|#{1,6}\s"  # markdown
+    r"|[A-Z][A-Z ]{2,50}(?=\n|$)"  # short all-caps line
+    r")"
+)
+
+# Below this many chunks the pool overhead outweighs parallel hashing
+_HASH_POOL_MIN_CHUNKS = 64
+
+_hash_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    """Lazily create the shared pool for parallel chunk hashing."""
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 2, thread_name_prefix="hash"
+        )
+    return _hash_pool
+
+
+def _hash_items(doc_id: str, items: List[Tuple[str, str]]) -> List[str]:
+    """
+    Hash (chunk_id, chunk_text) pairs, fanning out to the pool for large docs.
+
+    Items are sharded across workers so each thread runs one batched call;
+    small documents stay on the calling thread.
+    """
+    if len(items) <= _HASH_POOL_MIN_CHUNKS:
+        return hash_chunks_batch(doc_id, items)
+
+    pool = _get_hash_pool()
+    n_shards = pool._max_workers
+    shard_size = -(-len(items) // n_shards)  # ceil division
+    shards = [items[i: i + shard_size] for i in range(0, len(items), shard_size)]
+    results = pool.map(partial(hash_chunks_batch, doc_id), shards)
+    return [h for shard in results for h in shard]
+
+
+def _skip_lf(text: str, i: int) -> int:
+    """Advance past a newline at position i; startswith handles bounds."""
+    return i + 1 if text.startswith("\n", i) else i
+
 
 def build_page_map(
     current_text: str,
@@ -36,10 +95,13 @@ def build_page_map(
     # Get marker positions
     markers = get_page_marker_positions(current_text)
 
+    # O(1) page lookups instead of a linear scan per marker
+    page_by_no = {p.page_no: p for p in pages}
+
     page_spans = []
     for i, (page_no, marker_start, marker_end) in enumerate(markers):
         # Find the corresponding page
-        page = next((p for p in pages if p.page_no == page_no), None)
+        page = page_by_no.get(page_no)
         if page is None:
             continue
 
@@ -53,9 +115,7 @@ def build_page_map(
             end = len(current_text)
 
         # Calculate character length (excluding marker itself)
-        content_start = marker_end
-        if content_start < len(current_text) and current_text[content_start] == "\n":
-            content_start += 1
+        content_start = _skip_lf(current_text, marker_end)
         char_len = end - content_start
 
         # Compute hash
@@ -68,6 +128,7 @@ def build_page_map(
                 end=end,
                 char_len=char_len,
                 hash=page_hash,
+                content_start=content_start,
             )
         )
 
@@ -86,17 +147,9 @@ def _find_paragraph_boundaries(text: str) -> List[int]:
     Returns:
         Sorted list of potential boundary positions
     """
-    boundaries = set()
-
-    # Double newlines (strong boundary)
-    for match in re.finditer(r"\n\n+", text):
-        boundaries.add(match.end())
-
-    # Single newlines (weak boundary)
-    for match in re.finditer(r"\n", text):
-        boundaries.add(match.end())
-
-    return sorted(boundaries)
+    # One scan: finditer yields in order, so the list is already sorted
+    # and duplicate-free
+    return [match.end() for match in _NL_RE.finditer(text)]
 
 
 def _find_heading_boundaries(text: str) -> List[int]:
@@ -114,59 +167,102 @@ def _find_heading_boundaries(text: str) -> List[int]:
     Returns:
         Sorted list of potential boundary positions
     """
-    boundaries = set()
-
-    # Numbered headings: "1.", "1.1", "1.1.1" etc. at line start
-    for match in re.finditer(r"(?:^|\n)(\d+(?:\.\d+)*\.?\s)", text):
-        boundaries.add(match.start())
-
-    # Markdown-style headings
-    for match in re.finditer(r"(?:^|\n)(#{1,6}\s)", text):
-        boundaries.add(match.start())
-
-    # All-caps lines (potential headings)
-    for match in re.finditer(r"(?:^|\n)([A-Z][A-Z\s]{2,50})(?:\n|$)", text):
-        boundaries.add(match.start())
-
-    # Also include paragraph boundaries
-    boundaries.update(_find_paragraph_boundaries(text))
-
-    return sorted(boundaries)
+    # One scan over the combined alternation instead of one per shape
+    heading_starts = [match.start() for match in _HEADING_START_RE.finditer(text)]
+    paragraph_ends = _find_paragraph_boundaries(text)
+    return _merge_boundaries(heading_starts, paragraph_ends)
+
+
+def _merge_boundaries(heading_starts: List[int], paragraph_ends: List[int]) -> List[int]:
+    """Merge two sorted boundary lists, deduping, without set() + sorted()."""
+    boundaries: List[int] = []
+    i = j = 0
+    n_h, n_p = len(heading_starts), len(paragraph_ends)
+    while i < n_h and j < n_p:
+        h, p = heading_starts[i], paragraph_ends[j]
+        if h <= p:
+            boundaries.append(h)
+            i += 1
+            if h == p:
+                j += 1
+        else:
+            boundaries.append(p)
+            j += 1
+    boundaries.extend(heading_starts[i:])
+    boundaries.extend(paragraph_ends[j:])
+    return boundaries
 
 
-def _snap_to_boundary(
-    position: int,
+def _chunk_text_snapped(
+    text: str,
+    chunk_size: int,
+    overlap: int,
     boundaries: List[int],
-    min_pos: int,
-    max_pos: int,
     snap_range: int = 100,
-) -> int:
+) -> List[Tuple[int, int]]:
     """
-    Snap a position to the nearest boundary within range.
+    Chunk text, snapping window edges to the nearest boundary within range.
+
+    The shared loop behind the paragraph and heading modes, which differ
+    only in how `boundaries` is produced. The snap — binary-search the
+    allowed window, compare the two neighbors of the insertion point, with
+    the lower neighbor winning ties — is inlined at both uses since it
+    runs twice per chunk.
 
     Args:
-        position: Target position
-        boundaries: List of boundary positions
-        min_pos: Minimum allowed position
-        max_pos: Maximum allowed position
+        text: Text to chunk
+        chunk_size: Target chunk size
+        overlap: Overlap between chunks
+        boundaries: Sorted boundary positions local to text
         snap_range: Maximum distance to snap
 
     Returns:
-        Snapped position
+        List of (start, end) tuples relative to text
     """
-    best_pos = position
-    best_dist = snap_range + 1
+    chunks = []
+    text_len = len(text)
+    step = max(1, chunk_size - overlap)
 
-    for boundary in boundaries:
-        if boundary < min_pos or boundary > max_pos:
-            continue
+    pos = 0
+    while pos < text_len:
+        # Snap the raw end to the nearest boundary in (pos, text_len]
+        raw_end = min(pos + chunk_size, text_len)
+        end = raw_end
+        lo = bisect.bisect_left(boundaries, pos + 1)
+        hi = bisect.bisect_right(boundaries, text_len)
+        if lo < hi:
+            i = bisect.bisect_left(boundaries, raw_end, lo, hi)
+            best = snap_range + 1
+            if i > lo and raw_end - boundaries[i - 1] < best:
+                best = raw_end - boundaries[i - 1]
+                end = boundaries[i - 1]
+            if i < hi and boundaries[i] - raw_end < best:
+                end = boundaries[i]
 
-        dist = abs(boundary - position)
-        if dist < best_dist:
-            best_dist = dist
-            best_pos = boundary
+        chunks.append((pos, end))
 
-    return best_pos
+        if end >= text_len:
+            break
+
+        # Snap the next start to a boundary in [end - overlap, end]
+        raw_next = pos + step
+        next_pos = raw_next
+        lo = bisect.bisect_left(boundaries, end - overlap)
+        hi = bisect.bisect_right(boundaries, end)
+        if lo < hi:
+            i = bisect.bisect_left(boundaries, raw_next, lo, hi)
+            best = snap_range + 1
+            if i > lo and raw_next - boundaries[i - 1] < best:
+                best = raw_next - boundaries[i - 1]
+                next_pos = boundaries[i - 1]
+            if i < hi and boundaries[i] - raw_next < best:
+                next_pos = boundaries[i]
+        if next_pos <= pos:
+            next_pos = pos + step
+
+        pos = next_pos
+
+    return chunks
 
 
 def _chunk_text_chars(
@@ -188,27 +284,26 @@ def _chunk_text_chars(
     if not text:
         return []
 
-    chunks = []
     text_len = len(text)
-    step = max(1, chunk_size - overlap)
-
-    pos = 0
-    while pos < text_len:
-        end = min(pos + chunk_size, text_len)
-        chunks.append((pos, end))
+    if text_len <= chunk_size:
+        return [(0, text_len)]
 
-        if end >= text_len:
-            break
-
-        pos += step
-
-    return chunks
+    # Window starts are an arithmetic sequence, so compute the last start
+    # in closed form instead of stepping a while-loop: generation stops at
+    # the first window that reaches the end of the text
+    step = max(1, chunk_size - overlap)
+    last = -(-(text_len - chunk_size) // step) * step  # ceil division
+    return [
+        (pos, min(pos + chunk_size, text_len))
+        for pos in range(0, last + 1, step)
+    ]
 
 
 def _chunk_text_paragraph(
     text: str,
     chunk_size: int,
     overlap: int,
+    boundaries: Optional[List[int]] = None,
 ) -> List[Tuple[int, int]]:
     """
     Chunk text by paragraph boundaries.
@@ -217,6 +312,8 @@ def _chunk_text_paragraph(
         text: Text to chunk
         chunk_size: Target chunk size
         overlap: Overlap between chunks
+        boundaries: Precomputed boundary positions (local to text); scanned
+            from text when omitted
 
     Returns:
         List of (start, end) tuples relative to text
@@ -224,43 +321,16 @@ def _chunk_text_paragraph(
     if not text:
         return []
 
-    boundaries = _find_paragraph_boundaries(text)
-    chunks = []
-    text_len = len(text)
-    step = max(1, chunk_size - overlap)
-
-    pos = 0
-    while pos < text_len:
-        # Calculate raw end position
-        raw_end = min(pos + chunk_size, text_len)
-
-        # Snap end to nearest paragraph boundary
-        end = _snap_to_boundary(raw_end, boundaries, pos + 1, text_len)
-        if end == raw_end and raw_end < text_len:
-            # If no boundary found, use raw position
-            end = raw_end
-
-        chunks.append((pos, end))
-
-        if end >= text_len:
-            break
-
-        # Calculate next start position
-        next_pos = pos + step
-        # Snap next start to boundary
-        next_pos = _snap_to_boundary(next_pos, boundaries, end - overlap, end)
-        if next_pos <= pos:
-            next_pos = pos + step
-
-        pos = next_pos
-
-    return chunks
+    if boundaries is None:
+        boundaries = _find_paragraph_boundaries(text)
+    return _chunk_text_snapped(text, chunk_size, overlap, boundaries)
 
 
 def _chunk_text_heading(
     text: str,
     chunk_size: int,
     overlap: int,
+    boundaries: Optional[List[int]] = None,
 ) -> List[Tuple[int, int]]:
     """
     Chunk text by heading boundaries.
@@ -269,6 +339,8 @@ def _chunk_text_heading(
         text: Text to chunk
         chunk_size: Target chunk size
         overlap: Overlap between chunks
+        boundaries: Precomputed boundary positions (local to text); scanned
+            from text when omitted
 
     Returns:
         List of (start, end) tuples relative to text
@@ -276,40 +348,15 @@ def _chunk_text_heading(
     if not text:
         return []
 
-    boundaries = _find_heading_boundaries(text)
-    chunks = []
-    text_len = len(text)
-    step = max(1, chunk_size - overlap)
-
-    pos = 0
-    while pos < text_len:
-        # Calculate raw end position
-        raw_end = min(pos + chunk_size, text_len)
-
-        # Snap end to nearest heading boundary
-        end = _snap_to_boundary(raw_end, boundaries, pos + 1, text_len)
-        if end == raw_end and raw_end < text_len:
-            end = raw_end
-
-        chunks.append((pos, end))
-
-        if end >= text_len:
-            break
-
-        # Calculate next start position
-        next_pos = pos + step
-        next_pos = _snap_to_boundary(next_pos, boundaries, end - overlap, end)
-        if next_pos <= pos:
-            next_pos = pos + step
-
-        pos = next_pos
-
-    return chunks
+    if boundaries is None:
+        boundaries = _find_heading_boundaries(text)
+    return _chunk_text_snapped(text, chunk_size, overlap, boundaries)
 
 
 def _chunk_page_text(
     text: str,
     strategy: ChunkStrategy,
+    boundaries: Optional[List[int]] = None,
 ) -> List[Tuple[int, int]]:
     """
     Chunk a page's text according to strategy.
@@ -317,6 +364,8 @@ def _chunk_page_text(
     Args:
         text: Page text content
         strategy: Chunking strategy
+        boundaries: Precomputed boundary positions (local to text) for the
+            paragraph/heading modes; scanned from text when omitted
 
     Returns:
         List of (start, end) tuples relative to text
@@ -324,14 +373,67 @@ def _chunk_page_text(
     if strategy.split_mode == "chars":
         return _chunk_text_chars(text, strategy.chunk_size, strategy.overlap)
     elif strategy.split_mode == "paragraph":
-        return _chunk_text_paragraph(text, strategy.chunk_size, strategy.overlap)
+        return _chunk_text_paragraph(
+            text, strategy.chunk_size, strategy.overlap, boundaries
+        )
     elif strategy.split_mode == "heading":
-        return _chunk_text_heading(text, strategy.chunk_size, strategy.overlap)
+        return _chunk_text_heading(
+            text, strategy.chunk_size, strategy.overlap, boundaries
+        )
     else:
         # Default to chars
         return _chunk_text_chars(text, strategy.chunk_size, strategy.overlap)
 
 
+def _page_boundaries(
+    current_text: str,
+    content_start: int,
+    content_end: int,
+    page_content: str,
+    global_paras: List[int],
+    global_heads: Optional[List[int]],
+) -> List[int]:
+    """
+    Translate document-global boundaries into one page's local offsets.
+
+    Boundary scans run once over current_text in chunk_pages; each page
+    then binary-searches its [content_start, content_end] window out of
+    the shared sorted lists instead of re-scanning its slice.
+
+    Args:
+        current_text: Full text with page markers
+        content_start: Global offset where the page content begins
+        content_end: Global offset where the page content ends
+        page_content: The page's slice of current_text
+        global_paras: Newline-end positions over current_text
+        global_heads: Heading-start positions over current_text, or None
+            for paragraph mode
+
+    Returns:
+        Sorted, deduped boundary positions local to page_content
+    """
+    # Newline ends strictly inside the window; the newline that separates
+    # the marker from the content belongs to the marker, not the page
+    lo = bisect.bisect_right(global_paras, content_start)
+    hi = bisect.bisect_right(global_paras, content_end)
+    paras = [b - content_start for b in global_paras[lo:hi]]
+    if global_heads is None:
+        return paras
+
+    # Heading starts sit on the preceding newline, so a heading at the top
+    # of a page matches one position before content_start — outside the
+    # window. The per-page scan found it through ^ instead; reproduce that
+    # with one anchored match (a slice that opens with \n is already
+    # covered by the global list, whose match starts on that newline)
+    heads: List[int] = []
+    if not page_content.startswith("\n") and _HEADING_START_RE.match(page_content):
+        heads.append(0)
+    lo = bisect.bisect_right(global_heads, content_start - 1)
+    hi = bisect.bisect_left(global_heads, content_end)
+    heads.extend(b - content_start for b in global_heads[lo:hi])
+    return _merge_boundaries(heads, paras)
+
+
 def chunk_pages(
     current_text: str,
     page_map: List[PageSpan],
@@ -357,32 +459,62 @@ def chunk_pages(
 
     chunks = []
     total_chunk_idx = 0
+    pending: List[Tuple[str, int, int, int, List[str]]] = []
+    hash_items: List[Tuple[str, str]] = []
+
+    # Bind the per-chunk callables to locals: the inner loop runs once per
+    # chunk, and LOAD_FAST beats an attribute lookup each iteration
+    pending_append = pending.append
+    hash_items_append = hash_items.append
+
+    # O(1) page lookups instead of a linear scan per span
+    page_by_no = {p.page_no: p for p in pages}
+
+    # Scan boundaries once over the whole text; each page pulls its window
+    # out of the shared sorted lists below instead of re-scanning its slice
+    global_paras: List[int] = []
+    global_heads: Optional[List[int]] = None
+    if strategy.split_mode == "paragraph":
+        global_paras = _find_paragraph_boundaries(current_text)
+    elif strategy.split_mode == "heading":
+        global_paras = _find_paragraph_boundaries(current_text)
+        global_heads = [m.start() for m in _HEADING_START_RE.finditer(current_text)]
 
     for page_span in page_map:
         page_no = page_span.page_no
 
         # Find corresponding page
-        page = next((p for p in pages if p.page_no == page_no), None)
+        page = page_by_no.get(page_no)
         if page is None:
             continue
 
-        # Get page content from current_text (after the marker)
-        # Find marker end
-        marker_end = page_span.start
-        for match in PAGE_MARKER_PATTERN.finditer(current_text[page_span.start:page_span.end]):
-            marker_end = page_span.start + match.end()
-            break
-
-        # Skip newline after marker
-        content_start = marker_end
-        if content_start < len(current_text) and current_text[content_start] == "\n":
-            content_start += 1
+        # Page content starts past the marker; build_page_map already found
+        # that offset, so reuse it. Page maps built without the cached field
+        # (older persisted sessions, JSONL import) fall back to the anchored
+        # match at page_span.start
+        content_start = page_span.content_start
+        if content_start is None:
+            match = PAGE_MARKER_PATTERN.match(
+                current_text, page_span.start, page_span.end
+            )
+            marker_end = match.end() if match else page_span.start
+            content_start = _skip_lf(current_text, marker_end)
 
         content_end = page_span.end
         page_content = current_text[content_start:content_end]
 
-        # Chunk the page content
-        local_chunks = _chunk_page_text(page_content, strategy)
+        # Chunk the page content against the page's boundary window
+        boundaries = None
+        if strategy.split_mode in ("paragraph", "heading"):
+            boundaries = _page_boundaries(
+                current_text,
+                content_start,
+                content_end,
+                page_content,
+                global_paras,
+                global_heads,
+            )
+        local_chunks = _chunk_page_text(page_content, strategy, boundaries)
 
         for local_idx, (local_start, local_end) in enumerate(local_chunks):
             # Convert to global offsets in current_text
@@ -395,25 +527,42 @@ def chunk_pages(
             # Get chunk text
             chunk_text = current_text[global_start:global_end]
 
-            # Compute hash
-            chunk_hash = hash_chunk(doc_id, chunk_id, chunk_text)
-
-            # Check for warnings
+            # Check for warnings. strip() allocates a chunk-sized copy just
+            # to measure it, so only strip when the edges are whitespace —
+            # with clean edges the stripped length equals len(chunk_text)
             warnings = []
-            if len(chunk_text.strip()) < 10:
+            if len(chunk_text) < 10:
+                warnings.append("CHUNK_TOO_SHORT")
+            elif (
+                (chunk_text[0].isspace() or chunk_text[-1].isspace())
+                and len(chunk_text.strip()) < 10
+            ):
                 warnings.append("CHUNK_TOO_SHORT")
 
-            chunks.append(
-                ChildChunk(
-                    chunk_id=chunk_id,
-                    page_no=page_no,
-                    start=global_start,
-                    end=global_end,
-                    char_len=len(chunk_text),
-                    hash=chunk_hash,
-                    warnings=warnings,
-                )
-            )
+            pending_append((chunk_id, page_no, global_start, global_end, warnings))
+            hash_items_append((chunk_id, chunk_text))
             total_chunk_idx += 1
 
+    # Hash all chunks at once; large documents fan out across the pool
+    hashes = _hash_items(doc_id, hash_items)
+
+    chunks_append = chunks.append
+    construct = ChildChunk.model_construct
+    for (chunk_id, chunk_page_no, global_start, global_end, warnings), chunk_hash in zip(
+        pending, hashes
+    ):
+        # model_construct skips per-field validation; every value here is
+        # computed above from offsets we derived ourselves
+        chunks_append(
+            construct(
+                chunk_id=chunk_id,
+                page_no=chunk_page_no,
+                start=global_start,
+                end=global_end,
+                char_len=global_end - global_start,
+                hash=chunk_hash,
+                warnings=warnings,
+            )
+        )
+
     return chunks
@@ -4,8 +4,9 @@ Environment variables and settings
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 
 def _load_dotenv_files() -> None:
@@ -24,43 +25,60 @@ def _load_dotenv_files() -> None:
 _load_dotenv_files()
 
 
+# The getters are memoized: settings are fixed for the process lifetime,
+# so repeated reads (error handlers, hot paths) become dict lookups on the
+# cache instead of environ probes plus re-parsing.
+
+
+@lru_cache(maxsize=None)
 def get_env(key: str, default: str = "") -> str:
     """Get environment variable with default value."""
     return os.environ.get(key, default)
 
 
+@lru_cache(maxsize=None)
 def get_env_int(key: str, default: int) -> int:
     """Get environment variable as integer."""
     return int(os.environ.get(key, str(default)))
 
 
+@lru_cache(maxsize=None)
 def get_env_bool(key: str, default: bool) -> bool:
     """Get environment variable as boolean."""
-    val = os.environ.get(key, str(default)).lower()
-    return val in ("true", "1", "yes")
+    val = os.environ.get(key)
+    if val is None:
+        return default
+    return val.lower() in ("true", "1", "yes")
 
 
-def get_env_list(key: str, default: str = "") -> List[str]:
-    """Get environment variable as list (comma-separated)."""
+@lru_cache(maxsize=None)
+def _get_env_tuple(key: str, default: str) -> Tuple[str, ...]:
+    """Cached backing for get_env_list; tuples are safe to share."""
     val = os.environ.get(key, default)
     if not val:
-        return []
-    return [item.strip() for item in val.split(",") if item.strip()]
-
-
-class Settings:
-    """Application settings from environment variables."""
-
-    # General
-    CHUNKSMITH_ENV: str = get_env("CHUNKSMITH_ENV", "dev")
-    CHUNKSMITH_STORAGE_DIR: str = get_env("CHUNKSMITH_STORAGE_DIR", "./storage")
-    CHUNKSMITH_CLEAR_STORAGE_ON_STARTUP: bool = get_env_bool(
-        "CHUNKSMITH_CLEAR_STORAGE_ON_STARTUP", CHUNKSMITH_ENV == "dev"
-    )
-    CHUNKSMITH_MAX_PDF_MB: int = get_env_int("CHUNKSMITH_MAX_PDF_MB", 50)
-    CHUNKSMITH_CORS_ORIGINS: List[str] = get_env_list(
-        "CHUNKSMITH_CORS_ORIGINS", "http://localhost:5173"
-    )
+        return ()
+    return tuple(item.strip() for item in val.split(",") if item.strip())
+
+
+def get_env_list(key: str, default: str = "") -> List[str]:
+    """Get environment variable as list (comma-separated)."""
+    # Fresh list per call so callers can't mutate the cached value
+    return list(_get_env_tuple(key, default))
+
+
+class Settings:
+    """Application settings from environment variables."""
+
+    # General
+    CHUNKSMITH_ENV: str = get_env("CHUNKSMITH_ENV", "dev")
+    CHUNKSMITH_STORAGE_DIR: str = get_env("CHUNKSMITH_STORAGE_DIR", "./storage")
+    CHUNKSMITH_CLEAR_STORAGE_ON_STARTUP: bool = get_env_bool(
+        "CHUNKSMITH_CLEAR_STORAGE_ON_STARTUP", CHUNKSMITH_ENV == "dev"
+    )
+    CHUNKSMITH_MAX_PDF_MB: int = get_env_int("CHUNKSMITH_MAX_PDF_MB", 50)
+    CHUNKSMITH_CORS_ORIGINS: List[str] = get_env_list(
+        "CHUNKSMITH_CORS_ORIGINS", "http://localhost:5173"
+    )
 
     # PDF Extractor
     PDF_EXTRACTOR: str = get_env("PDF_EXTRACTOR", "pymupdf")
@@ -69,6 +87,9 @@ class Settings:
     # OpenAI / Bifrost (embedding)
     OPENAI_API_KEY: str = get_env("OPENAI_API_KEY", "")
     OPENAI_BASE_URL: str = get_env("OPENAI_BASE_URL", "https://api.openai.com/v1")
+    # Parallel embedding requests per provider when a commit splits its
+    # chunks into multiple API batches
+    EMBED_CONCURRENCY: int = get_env_int("EMBED_CONCURRENCY", 4)
 
     # OpenSearch
     OPENSEARCH_HOST: str = get_env("OPENSEARCH_HOST", "http://opensearch:9200")
@@ -77,6 +98,19 @@ class Settings:
     OPENSEARCH_VERIFY_SSL: bool = get_env_bool("OPENSEARCH_VERIFY_SSL", False)
     OPENSEARCH_USERNAME: str = get_env("OPENSEARCH_USERNAME", "")
     OPENSEARCH_PASSWORD: str = get_env("OPENSEARCH_PASSWORD", "")
+    # k-NN engine for new indices: "faiss" (default) stores the HNSW graph
+    # with fp16 scalar quantization at roughly half the memory; set
+    # "nmslib" to create indices matching the legacy layout
+    OPENSEARCH_KNN_ENGINE: str = get_env("OPENSEARCH_KNN_ENGINE", "faiss")
+    # Shards per chunk index; raise for corpora too large for one shard
+    OPENSEARCH_NUMBER_OF_SHARDS: int = get_env_int("OPENSEARCH_NUMBER_OF_SHARDS", 1)
+    # Native hybrid query (OpenSearch 2.17+). Requires a search pipeline
+    # with a normalization processor configured on the cluster; the
+    # default keeps the bool.should union that works everywhere.
+    OPENSEARCH_NATIVE_HYBRID: bool = get_env_bool("OPENSEARCH_NATIVE_HYBRID", False)
+
+    # Background Jobs
+    COMMIT_WORKERS: int = get_env_int("COMMIT_WORKERS", 4)
 
     # Default Chunk Strategy
     DEFAULT_CHUNK_SIZE: int = get_env_int("DEFAULT_CHUNK_SIZE", 800)
@@ -33,8 +33,58 @@ def hash_page(doc_id: str, page_no: int, page_text: str) -> str:
     Returns:
         Hex-encoded hash
     """
-    content = f"{doc_id}:page:{page_no}:{page_text}"
-    return sha256_text(content)
+    # Stream the parts into the hasher instead of formatting and encoding
+    # one page-sized concatenation first
+    h = hashlib.sha256(usedforsecurity=False)
+    h.update(f"{doc_id}:page:{page_no}:".encode("utf-8"))
+    h.update(page_text.encode("utf-8"))
+    return h.hexdigest()
+
+
+def hash_chunks_batch(doc_id: str, items: list[tuple[str, str]]) -> list[str]:
+    """
+    Compute chunk hashes for many (chunk_id, chunk_text) pairs in one pass.
+
+    Produces the same values as calling hash_chunk() per item, but amortizes
+    per-call overhead (hasher setup, prefix formatting) across the batch,
+    which matters for large JSONL imports.
+
+    Args:
+        doc_id: Document identifier shared by all items
+        items: List of (chunk_id, chunk_text) tuples
+
+    Returns:
+        List of hex-encoded hashes, aligned with `items`
+    """
+    prefix = f"{doc_id}:chunk:".encode("utf-8")
+    return [
+        _hash_chunk_bytes(prefix, chunk_id, chunk_text)
+        for chunk_id, chunk_text in items
+    ]
+
+
+def _hash_chunk_bytes(doc_prefix: bytes, chunk_id: str, chunk_text: str) -> str:
+    """
+    Compute a chunk hash from a pre-encoded "{doc_id}:chunk:" prefix.
+
+    Streaming the parts into the hasher avoids formatting and encoding a
+    chunk-sized concatenation per call; the digest is identical to
+    hash_chunk.
+
+    Args:
+        doc_prefix: Pre-encoded b"{doc_id}:chunk:" prefix
+        chunk_id: Chunk identifier
+        chunk_text: Chunk text content
+
+    Returns:
+        Hex-encoded hash
+    """
+    h = hashlib.sha256(usedforsecurity=False)
+    h.update(doc_prefix)
+    h.update(chunk_id.encode("utf-8"))
+    h.update(b":")
+    h.update(chunk_text.encode("utf-8"))
+    return h.hexdigest()
 
 
 def hash_chunk(doc_id: str, chunk_id: str, chunk_text: str) -> str:
@@ -52,5 +102,4 @@ def hash_chunk(doc_id: str, chunk_id: str, chunk_text: str) -> str:
     Returns:
         Hex-encoded hash
     """
-    content = f"{doc_id}:chunk:{chunk_id}:{chunk_text}"
-    return sha256_text(content)
+    return _hash_chunk_bytes(f"{doc_id}:chunk:".encode("utf-8"), chunk_id, chunk_text)
@@ -1,37 +1,56 @@
-"""
-ChunkSmith Hybrid - Logging Utilities
-"""
-
-import logging
-import sys
-
-from .config import settings
-
-
-def get_logger(name: str) -> logging.Logger:
-    """
-    Get a configured logger.
-
-    Args:
-        name: Logger name (usually __name__)
-
-    Returns:
-        Configured logger
-    """
-    logger = logging.getLogger(name)
-
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        # Set level based on environment
-        if settings.CHUNKSMITH_ENV == "dev":
-            logger.setLevel(logging.DEBUG)
-        else:
-            logger.setLevel(logging.INFO)
-
-    return logger
+"""
+ChunkSmith Hybrid - Logging Utilities
+"""
+
+import logging
+import sys
+import threading
+
+from .config import settings
+
+_configure_lock = threading.Lock()
+
+
+def _configure_root() -> None:
+    """
+    Attach the stream handler and level to the root logger, once.
+
+    Configuring the root instead of every named logger means get_logger
+    stays a plain lookup, and the lock closes the race where two threads
+    both see no handlers and both attach one.
+    """
+    with _configure_lock:
+        root = logging.getLogger()
+        if root.hasHandlers():
+            return
+
+        handler = logging.StreamHandler(sys.stdout)
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        )
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+
+        # Set level based on environment
+        if settings.CHUNKSMITH_ENV == "dev":
+            root.setLevel(logging.DEBUG)
+        else:
+            root.setLevel(logging.INFO)
+
+
+_configure_root()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Get a configured logger.
+
+    Args:
+        name: Logger name (usually __name__)
+
+    Returns:
+        Configured logger
+    """
+    # Handlers and level live on the root (configured at import), so this
+    # is just the logging module's cached dict lookup
+    return logging.getLogger(name)
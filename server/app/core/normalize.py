@@ -8,6 +8,10 @@ from typing import List
 
 from .models import RawPage
 
+# Compiled once at import: 3+ consecutive blank lines (lines holding only
+# whitespace), to be reduced to 2
+_BLANK_RE = re.compile(r"\n\s*\n\s*\n(\s*\n)+")
+
 
 def normalize_text(text: str) -> str:
     """
@@ -26,14 +30,15 @@ def normalize_text(text: str) -> str:
     Returns:
         Normalized text
     """
-    # Convert Windows line endings
-    text = text.replace("\r\n", "\n")
+    # Convert Windows line endings; the single-char probe skips the
+    # replace scan (and its full-length copy) on LF-only input, which is
+    # nearly every page
+    if "\r" in text:
+        text = text.replace("\r\n", "\n")
 
     # Reduce excessive blank lines (3+ -> 2)
     # A blank line is a line with only whitespace
-    text = re.sub(r"\n\s*\n\s*\n(\s*\n)+", "\n\n\n", text)
-
-    return text
+    return _BLANK_RE.sub("\n\n\n", text)
 
 
 def normalize_page(page: RawPage) -> RawPage:
@@ -46,7 +51,9 @@ def normalize_page(page: RawPage) -> RawPage:
     Returns:
         New RawPage with normalized text
     """
-    return RawPage(
+    # model_construct skips re-validating fields copied from an already
+    # validated RawPage
+    return RawPage.model_construct(
         page_no=page.page_no,
         text=normalize_text(page.text),
     )
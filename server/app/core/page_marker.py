@@ -4,6 +4,7 @@ Build and parse page markers in full text
 """
 
 import re
+from itertools import chain
 from typing import List
 
 from .errors import PageMarkerInvalidError
@@ -14,6 +15,41 @@ from .models import RawPage
 PAGE_MARKER_PATTERN = re.compile(r"<<<PAGE:(\d+)>>>")
 PAGE_MARKER_FORMAT = "<<<PAGE:{page_no}>>>"
 
+_MARKER_PREFIX = "<<<PAGE:"
+_MARKER_PREFIX_LEN = len(_MARKER_PREFIX)
+_MARKER_SUFFIX = ">>>"
+
+
+def _iter_markers(current_text: str):
+    """
+    Yield (page_no, start, end) for every page marker in the text.
+
+    Walks the literal marker anchors with str.find (memchr under the
+    hood) instead of the regex engine, so no Match object is allocated
+    per marker; yields exactly what PAGE_MARKER_PATTERN.finditer matches
+    (isdecimal mirrors the \\d class).
+
+    Args:
+        current_text: Full text with page markers
+
+    Yields:
+        (page_no, start, end) tuples
+    """
+    find = current_text.find
+    i = find(_MARKER_PREFIX)
+    while i >= 0:
+        digits_start = i + _MARKER_PREFIX_LEN
+        j = find(_MARKER_SUFFIX, digits_start)
+        if j < 0:
+            # No closing anchor left anywhere, so no marker can complete
+            return
+        digits = current_text[digits_start:j]
+        if digits and digits.isdecimal():
+            yield int(digits), i, j + 3
+            i = find(_MARKER_PREFIX, j + 3)
+        else:
+            i = find(_MARKER_PREFIX, i + 1)
+
 
 def build_text(pages: List[RawPage]) -> str:
     """
@@ -34,13 +70,12 @@ def build_text(pages: List[RawPage]) -> str:
     if not pages:
         return ""
 
-    parts = []
-    for page in pages:
-        marker = PAGE_MARKER_FORMAT.format(page_no=page.page_no)
-        parts.append(marker)
-        parts.append(page.text)
-
-    return "\n".join(parts)
+    # One flat join over interleaved marker/text parts; f-strings beat
+    # str.format for the marker and no intermediate list is appended twice
+    # per page
+    return "\n".join(
+        chain.from_iterable((f"<<<PAGE:{page.page_no}>>>", page.text) for page in pages)
+    )
 
 
 def parse_text(current_text: str, expected_page_count: int) -> List[RawPage]:
@@ -70,11 +105,25 @@ def parse_text(current_text: str, expected_page_count: int) -> List[RawPage]:
             )
         return []
 
-    # Find all page markers with their positions
+    # Valid text carries exactly the markers 1..expected_page_count in
+    # order, so a running counter classifies every deviation as it is
+    # seen — no found-number list, no set algebra, no separate order pass
     markers = []
-    for match in PAGE_MARKER_PATTERN.finditer(current_text):
-        page_no = int(match.group(1))
-        markers.append((page_no, match.start(), match.end()))
+    expected = 1
+    for page_no, start, end in _iter_markers(current_text):
+        if page_no != expected:
+            if page_no < expected:
+                # Pages 1..expected-1 have all been seen, so this repeats one
+                raise PageMarkerInvalidError(
+                    "Duplicate page markers found",
+                    {"duplicates": [page_no]},
+                )
+            raise PageMarkerInvalidError(
+                "Missing page markers",
+                {"missing_pages": list(range(expected, page_no))},
+            )
+        markers.append((page_no, start, end))
+        expected += 1
 
     # Check for missing markers
     if not markers:
@@ -83,61 +132,33 @@ def parse_text(current_text: str, expected_page_count: int) -> List[RawPage]:
             {"expected_page_count": expected_page_count},
         )
 
-    # Extract page numbers found
-    found_page_nos = [m[0] for m in markers]
-
-    # Check for duplicates
-    if len(found_page_nos) != len(set(found_page_nos)):
-        duplicates = [p for p in found_page_nos if found_page_nos.count(p) > 1]
-        raise PageMarkerInvalidError(
-            "Duplicate page markers found",
-            {"duplicates": list(set(duplicates))},
-        )
-
-    # Check for expected pages
-    expected_pages = set(range(1, expected_page_count + 1))
-    found_pages = set(found_page_nos)
-
-    missing = expected_pages - found_pages
-    extra = found_pages - expected_pages
-
-    if missing:
+    found_count = expected - 1
+    if found_count < expected_page_count:
         raise PageMarkerInvalidError(
             "Missing page markers",
-            {"missing_pages": sorted(missing)},
+            {"missing_pages": list(range(expected, expected_page_count + 1))},
         )
-
-    if extra:
+    if found_count > expected_page_count:
         raise PageMarkerInvalidError(
             "Unexpected page markers",
-            {"extra_pages": sorted(extra)},
+            {"extra_pages": list(range(expected_page_count + 1, expected))},
         )
 
-    # Check order
-    for i in range(len(found_page_nos) - 1):
-        if found_page_nos[i] >= found_page_nos[i + 1]:
-            raise PageMarkerInvalidError(
-                "Page markers are not in sequential order",
-                {
-                    "position": i,
-                    "found_order": found_page_nos,
-                },
-            )
-
     # Extract pages
     pages = []
     for i, (page_no, start, end) in enumerate(markers):
-        # Content starts after the marker
+        # Content starts after the marker; skip the newline after it if
+        # present. startswith/endswith at an offset do their own bounds
+        # handling and never materialize a one-char string
         content_start = end
-        # Skip the newline after marker if present
-        if content_start < len(current_text) and current_text[content_start] == "\n":
+        if current_text.startswith("\n", content_start):
             content_start += 1
 
         # Content ends at next marker or end of text
         if i + 1 < len(markers):
             content_end = markers[i + 1][1]
             # Remove trailing newline before next marker
-            if content_end > 0 and current_text[content_end - 1] == "\n":
+            if current_text.endswith("\n", 0, content_end):
                 content_end -= 1
         else:
             content_end = len(current_text)
@@ -158,8 +179,4 @@ def get_page_marker_positions(current_text: str) -> List[tuple]:
     Returns:
         List of (page_no, start, end) tuples
     """
-    markers = []
-    for match in PAGE_MARKER_PATTERN.finditer(current_text):
-        page_no = int(match.group(1))
-        markers.append((page_no, match.start(), match.end()))
-    return markers
+    return list(_iter_markers(current_text))
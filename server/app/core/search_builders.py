@@ -5,6 +5,49 @@ Build OpenSearch queries for text/vector/hybrid search
 
 from typing import Any, Dict, List, Optional
 
+from .config import settings
+
+# Fields actually consumed from hits; excludes the indexed text body and the
+# embedding vector, which would otherwise dominate every hit's payload
+_SOURCE_FIELDS = [
+    "doc_id",
+    "session_id",
+    "chunk_id",
+    "page_no",
+    "start",
+    "end",
+    "char_len",
+    "metadata",
+]
+
+# Server-side 200-char snippet: matched fragment when the query hits the
+# text field, leading 200 chars otherwise (no_match_size), no markup tags
+_SNIPPET_HIGHLIGHT = {
+    "pre_tags": [""],
+    "post_tags": [""],
+    "fields": {
+        "text": {
+            "fragment_size": 200,
+            "number_of_fragments": 1,
+            "no_match_size": 200,
+        }
+    },
+}
+
+
+# Returned for filterless queries; never stored into a body, never mutated
+_NO_FILTERS: List[Dict[str, Any]] = []
+
+
+def _apply_source_filter(body: Dict[str, Any]) -> Dict[str, Any]:
+    """Restrict _source to consumed fields and snippet via highlight."""
+    body["_source"] = {"includes": _SOURCE_FIELDS}
+    body["highlight"] = _SNIPPET_HIGHLIGHT
+    # Nothing reads hits.total, and exact totals force the engine to
+    # score every match instead of stopping at top_k
+    body["track_total_hits"] = False
+    return body
+
 
 def build_text_query(
     query: str,
@@ -47,7 +90,7 @@ def build_text_query(
     if filter_clauses:
         body["query"]["bool"]["filter"] = filter_clauses
 
-    return body
+    return _apply_source_filter(body)
 
 
 def build_knn_query(
@@ -90,7 +133,7 @@ def build_knn_query(
         },
     }
 
-    return body
+    return _apply_source_filter(body)
 
 
 def build_hybrid_query(
@@ -107,6 +150,12 @@ def build_hybrid_query(
     Uses bool.should to combine BM25 match and kNN queries.
     No RRF - just uses OpenSearch's native scoring.
 
+    With OPENSEARCH_NATIVE_HYBRID set, emits the native hybrid query
+    instead (OpenSearch 2.17+): the engine normalizes and combines the
+    two legs through its search pipeline and can terminate each leg at
+    top_k, rather than scoring the full should-union with raw BM25 and
+    cosine scores mixed on incomparable scales.
+
     Args:
         query: Search query text
         vector: Query embedding vector
@@ -140,6 +189,21 @@ def build_hybrid_query(
         }
     }
 
+    if settings.OPENSEARCH_NATIVE_HYBRID:
+        # hybrid takes no top-level filter, so push it into each leg
+        if filter_clauses:
+            text_leg: Dict[str, Any] = {
+                "bool": {"must": [text_clause], "filter": filter_clauses}
+            }
+            knn_clause["knn"]["vector"]["filter"] = {"bool": {"filter": filter_clauses}}
+        else:
+            text_leg = text_clause
+        body = {
+            "size": top_k,
+            "query": {"hybrid": {"queries": [text_leg, knn_clause]}},
+        }
+        return _apply_source_filter(body)
+
     # Combine with bool.should
     body: Dict[str, Any] = {
         "size": top_k,
@@ -154,7 +218,7 @@ def build_hybrid_query(
     if filter_clauses:
         body["query"]["bool"]["filter"] = filter_clauses
 
-    return body
+    return _apply_source_filter(body)
 
 
 def _build_filter_clauses(
@@ -170,10 +234,14 @@ def _build_filter_clauses(
         List of term filter clauses
     """
     if not filters:
-        return []
+        # Shared sentinel: callers only truth-test the result and attach
+        # it to the body when non-empty, so the empty case never escapes
+        return _NO_FILTERS
 
-    clauses = []
-    for field, value in filters.items():
-        clauses.append({"term": {field: value}})
+    if len(filters) == 1:
+        # The common shape — a single doc_id or session_id filter —
+        # skips the items() iteration machinery
+        (field, value), = filters.items()
+        return [{"term": {field: value}}]
 
-    return clauses
+    return [{"term": {field: value}} for field, value in filters.items()]
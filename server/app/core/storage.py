@@ -3,37 +3,94 @@ ChunkSmith Hybrid - Storage Layer
 JSON file persistence for sessions, jobs, and batches
 """
 
-import json
+import copy
 import os
 import shutil
 import tempfile
+from functools import lru_cache
+
+import orjson
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Tuple
 
 from .config import settings
 from .errors import BatchNotFoundError, JobNotFoundError, SessionNotFoundError
 from .logging import get_logger
 from .models import Batch, Session
+from .storage_cache import MtimeCache
 
 logger = get_logger(__name__)
 
+# Parsed-object caches for the read-heavy listing/detail endpoints; entries
+# are validated against file mtime so external writes are still picked up.
+_session_cache = MtimeCache()
+_batch_cache = MtimeCache()
+
+# Last-written job dicts: jobs are only ever written through save_job in
+# this process, so update_job's read-modify-write can skip the disk read.
+# Jobs are small (status, counters, a few error samples), so the copies
+# that keep callers from aliasing the cache are cheap.
+_job_cache: Dict[str, Dict[str, Any]] = {}
+
+# Directory listings keyed on the directory's mtime: creating or deleting
+# an entry bumps the parent directory's mtime, so a cached listing stays
+# valid exactly as long as the directory is untouched. Rewrites of an
+# existing file don't change the id set, so they can't stale the cache.
+_list_cache: Dict[str, Tuple[int, "list[str]"]] = {}
+
+
+def _cached_listing(dir_path: Path, build: "Callable[[], list[str]]") -> "list[str]":
+    """Return build() for dir_path, cached until the directory changes."""
+    try:
+        mtime_ns = os.stat(dir_path).st_mtime_ns
+    except FileNotFoundError:
+        return []
+
+    key = str(dir_path)
+    entry = _list_cache.get(key)
+    if entry is not None and entry[0] == mtime_ns:
+        return list(entry[1])
+
+    ids = build()
+    _list_cache[key] = (mtime_ns, ids)
+    return list(ids)
+
+
+def _scan_json_ids(dir_path: Path) -> "list[str]":
+    """
+    List the ids (stems) of .json files in a directory.
+
+    os.scandir walks the directory in one pass with no per-entry stat and
+    no Path construction, unlike glob, which matters once a storage dir
+    accumulates thousands of entries.
+    """
+    with os.scandir(dir_path) as it:
+        return [e.name[:-5] for e in it if e.name.endswith(".json")]
+
 
 def _ensure_dir(path: Path) -> None:
     """Ensure directory exists."""
     path.mkdir(parents=True, exist_ok=True)
-
-
-def _get_sessions_dir() -> Path:
-    """Get sessions storage directory."""
-    return Path(settings.CHUNKSMITH_STORAGE_DIR) / "sessions"
-
-
-def _get_jobs_dir() -> Path:
-    """Get jobs storage directory."""
-    return Path(settings.CHUNKSMITH_STORAGE_DIR) / "jobs"
-
-
+
+
+# The storage root is fixed for the process, so each Path is built once
+# instead of re-parsed on every storage operation
+
+
+@lru_cache(maxsize=None)
+def _get_sessions_dir() -> Path:
+    """Get sessions storage directory."""
+    return Path(settings.CHUNKSMITH_STORAGE_DIR) / "sessions"
+
+
+@lru_cache(maxsize=None)
+def _get_jobs_dir() -> Path:
+    """Get jobs storage directory."""
+    return Path(settings.CHUNKSMITH_STORAGE_DIR) / "jobs"
+
+
+@lru_cache(maxsize=None)
 def _get_batches_dir() -> Path:
     """Get batches storage directory."""
     return Path(settings.CHUNKSMITH_STORAGE_DIR) / "batches"
@@ -69,249 +126,414 @@ def purge_storage() -> None:
     _purge_dir_contents(_get_sessions_dir())
     _purge_dir_contents(_get_jobs_dir())
     _purge_dir_contents(_get_batches_dir())
+    _session_cache.clear()
+    _batch_cache.clear()
+    _job_cache.clear()
+    _list_cache.clear()
+
+
+def _safe_write(path: Path, data: "str | bytes") -> None:
+    """
+    Safely write data to file using atomic write pattern.
+    Write to temp file first, then rename (os.replace for atomicity).
+    """
+    _ensure_dir(path.parent)
+
+    # Create temp file in same directory to ensure same filesystem
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        if isinstance(data, bytes):
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+        else:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+        # Atomic replace
+        os.replace(tmp_path, path)
+    except Exception:
+        # Clean up temp file on error
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _fast_write(path: Path, data: bytes) -> None:
+    """
+    Write data straight to the final path, skipping the tempfile+rename
+    dance.
+
+    Only for files where a torn write is tolerable: job records are
+    rewritten on every progress tick, so a partial write is overwritten
+    moments later and, worst case, loses one progress update rather than
+    durable state. Sessions and batches stay on _safe_write.
+    """
+    _ensure_dir(path.parent)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def save_session(session: Session) -> None:
+    """
+    Save session to JSON file.
+
+    Args:
+        session: Session object to save
+    """
+    sessions_dir = _get_sessions_dir()
+    file_path = sessions_dir / f"{session.session_id}.json"
+
+    data = session.model_dump(mode="json")
+    # orjson emits bytes directly and is several times faster than stdlib
+    # json on these multi-MB session payloads
+    json_bytes = orjson.dumps(data)
+    _safe_write(file_path, json_bytes)
+    _session_cache.put(session.session_id, file_path, session)
+
+
+def save_sessions_bulk(sessions: "list[Session]") -> None:
+    """
+    Save multiple sessions in one call.
+
+    Each file is written atomically exactly like save_session and at the
+    same durability level; batching saves the per-session directory
+    lookup and keeps an N-file upload a single storage call.
+
+    Args:
+        sessions: Session objects to save
+    """
+    if not sessions:
+        return
+
+    sessions_dir = _get_sessions_dir()
+
+    for session in sessions:
+        file_path = sessions_dir / f"{session.session_id}.json"
+        data = session.model_dump(mode="json")
+        json_bytes = orjson.dumps(data)
+        _safe_write(file_path, json_bytes)
+        _session_cache.put(session.session_id, file_path, session)
+
+
+def load_session(session_id: str) -> Session:
+    """
+    Load session from JSON file.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        Session object
+
+    Raises:
+        SessionNotFoundError: If session file doesn't exist
+    """
+    sessions_dir = _get_sessions_dir()
+    file_path = sessions_dir / f"{session_id}.json"
+
+    cached = _session_cache.get(session_id, file_path)
+    if cached is not None:
+        # Deep copy so callers can mutate the result without corrupting
+        # the cache (string payloads are shared, so this stays cheap).
+        return cached.model_copy(deep=True)
+
+    if not file_path.exists():
+        raise SessionNotFoundError(session_id)
+
+    with open(file_path, "rb") as f:
+        data = orjson.loads(f.read())
+
+    session = Session(**data)
+    _session_cache.put(session_id, file_path, session)
+    return session
+
+
+def load_session_version(session_id: str) -> int:
+    """
+    Read only a session's current version.
+
+    Served straight from the mtime-validated cache without the deep copy
+    load_session makes, so optimistic-lock checks can fast-reject stale
+    writes without deserializing the full session.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        Current session version
+
+    Raises:
+        SessionNotFoundError: If session file doesn't exist
+    """
+    sessions_dir = _get_sessions_dir()
+    file_path = sessions_dir / f"{session_id}.json"
+
+    cached = _session_cache.get(session_id, file_path)
+    if cached is not None:
+        return cached.version
+
+    # Cache miss: a full load populates the cache for the write that follows
+    return load_session(session_id).version
+
+
+def delete_session(session_id: str) -> bool:
+    """
+    Delete session file.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        True if deleted, False if not found
+    """
+    sessions_dir = _get_sessions_dir()
+    file_path = sessions_dir / f"{session_id}.json"
+
+    _session_cache.invalidate(session_id)
+
+    if file_path.exists():
+        file_path.unlink()
+        return True
+    return False
+
+
+def list_sessions() -> list[str]:
+    """
+    List all session IDs.
+
+    Returns:
+        List of session IDs
+    """
+    sessions_dir = _get_sessions_dir()
+    return _cached_listing(sessions_dir, lambda: _scan_json_ids(sessions_dir))
+
+
+def save_job(job: Dict[str, Any]) -> None:
+    """
+    Save job state to JSON file.
+
+    Args:
+        job: Job dictionary (must contain 'job_id')
+    """
+    jobs_dir = _get_jobs_dir()
+    job_id = job["job_id"]
+    file_path = jobs_dir / f"{job_id}.json"
+
+    # Job dicts carry only JSON-native values (timestamps are stored as
+    # isoformat strings), so orjson serializes them directly
+    json_bytes = orjson.dumps(job)
+    _fast_write(file_path, json_bytes)
+    _job_cache[job_id] = copy.deepcopy(job)
+
+
+def load_job(job_id: str) -> Dict[str, Any]:
+    """
+    Load job from JSON file.
+
+    Args:
+        job_id: Job identifier
+
+    Returns:
+        Job dictionary
+
+    Raises:
+        JobNotFoundError: If job file doesn't exist
+    """
+    cached = _job_cache.get(job_id)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    jobs_dir = _get_jobs_dir()
+    file_path = jobs_dir / f"{job_id}.json"
+
+    if not file_path.exists():
+        raise JobNotFoundError(job_id)
+
+    with open(file_path, "rb") as f:
+        job = orjson.loads(f.read())
+    _job_cache[job_id] = copy.deepcopy(job)
+    return job
+
 
+def update_job(job_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Update job state.
+
+    Args:
+        job_id: Job identifier
+        updates: Fields to update
+
+    Returns:
+        Updated job dictionary
+    """
+    job = load_job(job_id)
+    job.update(updates)
+    save_job(job)
+    return job
+
+
+def list_jobs() -> list[str]:
+    """
+    List all job IDs.
+
+    Returns:
+        List of job IDs
+    """
+    jobs_dir = _get_jobs_dir()
+    return _cached_listing(jobs_dir, lambda: _scan_json_ids(jobs_dir))
+
+
+# ==================== Batch Storage ====================
+
+
+def _get_batches_index_path() -> Path:
+    """Get path of the append-only batch listing index."""
+    return _get_batches_dir() / "batches_index.jsonl"
+
+
+def _append_batch_index_entry(batch_id: str, created_at: datetime) -> None:
+    """Append a listing-index entry for a batch (best-effort)."""
+    path = _get_batches_index_path()
+    try:
+        _ensure_dir(path.parent)
+        line = orjson.dumps({"id": batch_id, "created_at": created_at.isoformat()}) + b"\n"
+        with open(path, "ab") as f:
+            f.write(line)
+    except Exception as e:
+        logger.warning(f"Failed to update batches index: {e}")
+
+
+def _rebuild_batches_index() -> Dict[str, str]:
+    """Rebuild the listing index by scanning batch files on disk."""
+    batches_dir = _get_batches_dir()
+    entries: Dict[str, str] = {}
+
+    for batch_id in _scan_json_ids(batches_dir):
+        path = batches_dir / f"{batch_id}.json"
+        try:
+            with open(path, "rb") as fh:
+                data = orjson.loads(fh.read())
+            entries[batch_id] = data.get("created_at", "")
+        except Exception as e:
+            logger.warning(f"Skipping corrupted batch file {path}: {e}")
+
+    try:
+        lines = b"".join(
+            orjson.dumps({"id": bid, "created_at": created}) + b"\n"
+            for bid, created in entries.items()
+        )
+        _safe_write(_get_batches_index_path(), lines)
+    except Exception as e:
+        logger.warning(f"Failed to rewrite batches index: {e}")
+
+    return entries
+
+
+def save_batch(batch: Batch) -> None:
+    """
+    Save batch to JSON file.
+
+    Args:
+        batch: Batch object to save
+    """
+    batches_dir = _get_batches_dir()
+    file_path = batches_dir / f"{batch.batch_id}.json"
+
+    data = batch.model_dump(mode="json")
+    json_bytes = orjson.dumps(data)
+    _safe_write(file_path, json_bytes)
+    _batch_cache.put(batch.batch_id, file_path, batch)
+    _append_batch_index_entry(batch.batch_id, batch.created_at)
+
+
+def load_batch(batch_id: str) -> Batch:
+    """
+    Load batch from JSON file.
+
+    Args:
+        batch_id: Batch identifier
+
+    Returns:
+        Batch object
+
+    Raises:
+        BatchNotFoundError: If batch file doesn't exist
+    """
+    batches_dir = _get_batches_dir()
+    file_path = batches_dir / f"{batch_id}.json"
+
+    cached = _batch_cache.get(batch_id, file_path)
+    if cached is not None:
+        return cached.model_copy(deep=True)
+
+    if not file_path.exists():
+        raise BatchNotFoundError(batch_id)
+
+    with open(file_path, "rb") as f:
+        data = orjson.loads(f.read())
+
+    batch = Batch(**data)
+    _batch_cache.put(batch_id, file_path, batch)
+    return batch
+
+
+def delete_batch(batch_id: str) -> bool:
+    """
+    Delete batch file.
+
+    Args:
+        batch_id: Batch identifier
+
+    Returns:
+        True if deleted, False if not found
+    """
+    batches_dir = _get_batches_dir()
+    file_path = batches_dir / f"{batch_id}.json"
+
+    _batch_cache.invalidate(batch_id)
+
+    if file_path.exists():
+        file_path.unlink()
+        return True
+    return False
+
+
+def list_batches() -> list[str]:
+    """
+    List all batch IDs, newest first.
+
+    Backed by the append-only batches_index.jsonl so listings only parse
+    (id, created_at) pairs instead of deserializing every batch file. The
+    index is rebuilt from disk when missing or corrupted; entries for
+    deleted batches are filtered out with a stat per id.
+
+    Returns:
+        List of batch IDs sorted by created_at descending
+    """
+    batches_dir = _get_batches_dir()
+    return _cached_listing(batches_dir, lambda: _list_batches_uncached(batches_dir))
+
+
+def _list_batches_uncached(batches_dir: Path) -> "list[str]":
+    """Compute the batch listing from the index plus a liveness stat per id."""
+    index_path = _get_batches_index_path()
+    entries: Dict[str, str] = {}
+    if index_path.exists():
+        try:
+            with open(index_path, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        entry = orjson.loads(line)
+                        entries[entry["id"]] = entry["created_at"]
+        except Exception as e:
+            logger.warning(f"Batches index corrupted, rebuilding: {e}")
+            entries = _rebuild_batches_index()
+    else:
+        entries = _rebuild_batches_index()
 
-def _datetime_serializer(obj: Any) -> Any:
-    """JSON serializer for datetime objects."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-
-def _safe_write(path: Path, data: str) -> None:
-    """
-    Safely write data to file using atomic write pattern.
-    Write to temp file first, then rename (os.replace for atomicity).
-    """
-    _ensure_dir(path.parent)
-
-    # Create temp file in same directory to ensure same filesystem
-    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            f.write(data)
-        # Atomic replace
-        os.replace(tmp_path, path)
-    except Exception:
-        # Clean up temp file on error
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
-        raise
-
-
-def save_session(session: Session) -> None:
-    """
-    Save session to JSON file.
-
-    Args:
-        session: Session object to save
-    """
-    sessions_dir = _get_sessions_dir()
-    file_path = sessions_dir / f"{session.session_id}.json"
-
-    data = session.model_dump(mode="json")
-    json_str = json.dumps(data, ensure_ascii=False, indent=2, default=_datetime_serializer)
-    _safe_write(file_path, json_str)
-
-
-def load_session(session_id: str) -> Session:
-    """
-    Load session from JSON file.
-
-    Args:
-        session_id: Session identifier
-
-    Returns:
-        Session object
-
-    Raises:
-        SessionNotFoundError: If session file doesn't exist
-    """
-    sessions_dir = _get_sessions_dir()
-    file_path = sessions_dir / f"{session_id}.json"
-
-    if not file_path.exists():
-        raise SessionNotFoundError(session_id)
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    return Session(**data)
-
-
-def delete_session(session_id: str) -> bool:
-    """
-    Delete session file.
-
-    Args:
-        session_id: Session identifier
-
-    Returns:
-        True if deleted, False if not found
-    """
-    sessions_dir = _get_sessions_dir()
-    file_path = sessions_dir / f"{session_id}.json"
-
-    if file_path.exists():
-        file_path.unlink()
-        return True
-    return False
-
-
-def list_sessions() -> list[str]:
-    """
-    List all session IDs.
-
-    Returns:
-        List of session IDs
-    """
-    sessions_dir = _get_sessions_dir()
-    if not sessions_dir.exists():
-        return []
-
-    return [f.stem for f in sessions_dir.glob("*.json")]
-
-
-def save_job(job: Dict[str, Any]) -> None:
-    """
-    Save job state to JSON file.
-
-    Args:
-        job: Job dictionary (must contain 'job_id')
-    """
-    jobs_dir = _get_jobs_dir()
-    job_id = job["job_id"]
-    file_path = jobs_dir / f"{job_id}.json"
-
-    json_str = json.dumps(job, ensure_ascii=False, indent=2, default=_datetime_serializer)
-    _safe_write(file_path, json_str)
-
-
-def load_job(job_id: str) -> Dict[str, Any]:
-    """
-    Load job from JSON file.
-
-    Args:
-        job_id: Job identifier
-
-    Returns:
-        Job dictionary
-
-    Raises:
-        JobNotFoundError: If job file doesn't exist
-    """
-    jobs_dir = _get_jobs_dir()
-    file_path = jobs_dir / f"{job_id}.json"
-
-    if not file_path.exists():
-        raise JobNotFoundError(job_id)
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-
-def update_job(job_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Update job state.
-
-    Args:
-        job_id: Job identifier
-        updates: Fields to update
-
-    Returns:
-        Updated job dictionary
-    """
-    job = load_job(job_id)
-    job.update(updates)
-    save_job(job)
-    return job
-
-
-def list_jobs() -> list[str]:
-    """
-    List all job IDs.
-
-    Returns:
-        List of job IDs
-    """
-    jobs_dir = _get_jobs_dir()
-    if not jobs_dir.exists():
-        return []
-
-    return [f.stem for f in jobs_dir.glob("*.json")]
-
-
-# ==================== Batch Storage ====================
-
-
-def save_batch(batch: Batch) -> None:
-    """
-    Save batch to JSON file.
-
-    Args:
-        batch: Batch object to save
-    """
-    batches_dir = _get_batches_dir()
-    file_path = batches_dir / f"{batch.batch_id}.json"
-
-    data = batch.model_dump(mode="json")
-    json_str = json.dumps(data, ensure_ascii=False, indent=2, default=_datetime_serializer)
-    _safe_write(file_path, json_str)
-
-
-def load_batch(batch_id: str) -> Batch:
-    """
-    Load batch from JSON file.
-
-    Args:
-        batch_id: Batch identifier
-
-    Returns:
-        Batch object
-
-    Raises:
-        BatchNotFoundError: If batch file doesn't exist
-    """
-    batches_dir = _get_batches_dir()
-    file_path = batches_dir / f"{batch_id}.json"
-
-    if not file_path.exists():
-        raise BatchNotFoundError(batch_id)
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    return Batch(**data)
-
-
-def delete_batch(batch_id: str) -> bool:
-    """
-    Delete batch file.
-
-    Args:
-        batch_id: Batch identifier
-
-    Returns:
-        True if deleted, False if not found
-    """
-    batches_dir = _get_batches_dir()
-    file_path = batches_dir / f"{batch_id}.json"
-
-    if file_path.exists():
-        file_path.unlink()
-        return True
-    return False
-
-
-def list_batches() -> list[str]:
-    """
-    List all batch IDs.
-
-    Returns:
-        List of batch IDs
-    """
-    batches_dir = _get_batches_dir()
-    if not batches_dir.exists():
-        return []
-
-    return [f.stem for f in batches_dir.glob("*.json")]
+    live = [
+        (bid, created)
+        for bid, created in entries.items()
+        if (batches_dir / f"{bid}.json").exists()
+    ]
+    live.sort(key=lambda item: item[1], reverse=True)
+    return [bid for bid, _ in live]
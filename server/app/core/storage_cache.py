@@ -0,0 +1,63 @@
+"""
+ChunkSmith Hybrid - Storage Cache
+mtime-validated in-memory cache for persisted JSON objects
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+class MtimeCache:
+    """
+    Small LRU cache keyed by object id, validated against file mtime.
+
+    A cached entry is only returned while the backing file's mtime_ns is
+    unchanged since the entry was stored, so writes from other processes
+    (or manual edits) are picked up automatically. Writers are expected to
+    call put() after saving and invalidate() after deleting.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[int, Any]] = {}
+
+    def get(self, key: str, path: Path) -> Optional[Any]:
+        """Return the cached object if the file is unchanged, else None."""
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != mtime_ns:
+                return None
+            # Move to the end to keep eviction order LRU
+            self._entries.pop(key)
+            self._entries[key] = entry
+            return entry[1]
+
+    def put(self, key: str, path: Path, obj: Any) -> None:
+        """Store an object for `key`, stamped with the file's current mtime."""
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (mtime_ns, obj)
+            while len(self._entries) > self._max_entries:
+                self._entries.pop(next(iter(self._entries)))
+
+    def invalidate(self, key: str) -> None:
+        """Drop the entry for `key`, if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
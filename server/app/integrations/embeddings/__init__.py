@@ -1,10 +1,17 @@
-"""ChunkSmith Hybrid - Embedding Providers"""
-
-from .base import EmbeddingProvider
-from .langchain_openai import LangChainOpenAIEmbeddingProvider, get_embedding_provider
-
-__all__ = [
-	"EmbeddingProvider",
-	"LangChainOpenAIEmbeddingProvider",
-	"get_embedding_provider",
-]
+"""ChunkSmith Hybrid - Embedding Providers"""
+
+from .base import EmbeddingProvider
+from .batcher import DynamicBatcher
+from .langchain_openai import (
+    LangChainOpenAIEmbeddingProvider,
+    clear_embedding_provider_cache,
+    get_embedding_provider,
+)
+
+__all__ = [
+	"EmbeddingProvider",
+	"DynamicBatcher",
+	"LangChainOpenAIEmbeddingProvider",
+	"clear_embedding_provider_cache",
+	"get_embedding_provider",
+]
@@ -0,0 +1,101 @@
+"""ChunkSmith Hybrid - Dynamic Embedding Batcher
+
+Coalesces concurrent single-query embed calls into one provider batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from ...core.errors import EmbeddingFailedError
+from ...core.logging import get_logger
+from .langchain_openai import get_embedding_provider
+
+logger = get_logger(__name__)
+
+
+class DynamicBatcher:
+    """
+    Micro-batching layer for query embeddings.
+
+    Concurrent callers awaiting embed() within a short window are collected
+    and dispatched as a single embed_texts() batch per model, amortizing
+    per-request model overhead under concurrent search load. With a single
+    in-flight caller the window adds at most `window_ms` of latency.
+    """
+
+    def __init__(self, max_batch: int = 32, window_ms: float = 5.0):
+        self._max_batch = max_batch
+        self._window_s = window_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_task: Optional[asyncio.Task] = None
+
+    def _ensure_worker(self) -> None:
+        """Start the flush worker lazily on the running loop."""
+        if self._worker_task is None or self._worker_task.done():
+            self._queue = asyncio.Queue()
+            self._worker_task = asyncio.get_running_loop().create_task(self._worker())
+
+    async def embed(self, model: str, text: str) -> List[float]:
+        """
+        Embed a single text, coalescing with other in-flight calls.
+
+        Args:
+            model: Embedding model name
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            EmbeddingFailedError: If the underlying provider fails
+        """
+        self._ensure_worker()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((model, text, future))
+        return await future
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[str, str, asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self._window_s
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            by_model: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+            for model, text, future in batch:
+                by_model.setdefault(model, []).append((text, future))
+
+            for model, items in by_model.items():
+                texts = [text for text, _ in items]
+                if len(texts) > 1:
+                    logger.info(f"Coalesced {len(texts)} embed calls for {model}")
+                try:
+                    vectors = await asyncio.to_thread(self._embed_batch, model, texts)
+                except Exception as e:
+                    for _, future in items:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for (_, future), vector in zip(items, vectors):
+                    if not future.done():
+                        future.set_result(vector)
+                # Guard against a provider returning fewer vectors than texts
+                for _, future in items[len(vectors):]:
+                    if not future.done():
+                        future.set_exception(
+                            EmbeddingFailedError("Provider returned too few vectors")
+                        )
+
+    @staticmethod
+    def _embed_batch(model: str, texts: List[str]) -> List[List[float]]:
+        return get_embedding_provider(model).embed_texts(texts)
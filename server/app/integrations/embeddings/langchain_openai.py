@@ -6,8 +6,11 @@ Bifrost等のOpenAI互換エンドポイントに対応。
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Optional
 
+import httpx
 from langchain_openai import OpenAIEmbeddings
 
 from ...core.config import settings
@@ -17,6 +20,26 @@ from .base import EmbeddingProvider
 
 logger = get_logger(__name__)
 
+# 1リクエストあたりの最大テキスト数。これを超える入力はバッチに分割し、
+# スレッドプールで並列にAPIへ投げる（待ち時間のほとんどがHTTP I/Oなので
+# GILの影響はほぼない）。
+_BATCH_SIZE = 256
+
+# 全provider共有のHTTPクライアント。keep-aliveで接続を使い回し、
+# embedのたびにTLSハンドシェイクを繰り返さない。プロセスと同寿命。
+_http_client: Optional[httpx.Client] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """共有のhttpx.Clientを返す（初回呼び出し時に生成）。"""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            timeout=httpx.Timeout(60.0),
+        )
+    return _http_client
+
 
 def _get_api_key() -> str:
     """API keyを取得。ローカルサーバーの場合はダミー値を返す。"""
@@ -36,6 +59,7 @@ class LangChainOpenAIEmbeddingProvider(EmbeddingProvider):
             model=model,
             openai_api_key=_get_api_key(),
             openai_api_base=settings.OPENAI_BASE_URL,
+            http_client=_get_http_client(),
         )
 
     def embed_texts(self, texts: List[str]) -> List[List[float]]:
@@ -43,7 +67,23 @@ class LangChainOpenAIEmbeddingProvider(EmbeddingProvider):
             return []
 
         try:
-            vectors = self._embeddings.embed_documents(texts)
+            if len(texts) <= _BATCH_SIZE:
+                vectors = self._embeddings.embed_documents(texts)
+            else:
+                batches = [
+                    texts[i : i + _BATCH_SIZE]
+                    for i in range(0, len(texts), _BATCH_SIZE)
+                ]
+                workers = min(settings.EMBED_CONCURRENCY, len(batches))
+                # executor.map は投入順に結果を返すため、順序は保たれる
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    vectors = [
+                        vector
+                        for batch_vectors in executor.map(
+                            self._embeddings.embed_documents, batches
+                        )
+                        for vector in batch_vectors
+                    ]
             if self._dimension is None and vectors:
                 self._dimension = len(vectors[0])
             return vectors
@@ -63,6 +103,16 @@ class LangChainOpenAIEmbeddingProvider(EmbeddingProvider):
         return f"langchain_openai:{self._model}"
 
 
+@lru_cache(maxsize=16)
 def get_embedding_provider(model: str) -> EmbeddingProvider:
-    """指定モデルの embedding provider を作成。"""
+    """指定モデルの embedding provider を返す（モデルごとにキャッシュ）。
+
+    providerはステートレスに近く（_dimensionの単純代入はGIL下でatomic）、
+    スレッド間で安全に共有できるため、呼び出しごとに作り直さない。
+    """
     return LangChainOpenAIEmbeddingProvider(model)
+
+
+def clear_embedding_provider_cache() -> None:
+    """providerキャッシュを破棄する（設定のホットリロード用）。"""
+    get_embedding_provider.cache_clear()
@@ -3,10 +3,11 @@ ChunkSmith - JSONL Parser
 Parse JSONL files into chunks for import
 """
 
-import json
-from typing import Any, Dict, List, Tuple
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple
 
-from ..core.errors import ChunkSmithError
+import orjson
+
+from ..core.errors import ChunkSmithError, ErrorCodes
 from ..core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -17,12 +18,21 @@ class JSONLParseError(ChunkSmithError):
 
     def __init__(self, message: str, line_no: int = 0):
         self.line_no = line_no
-        super().__init__(f"JSONL parse error at line {line_no}: {message}" if line_no else message)
+        super().__init__(
+            code=ErrorCodes.VALIDATION_ERROR,
+            message=f"JSONL parse error at line {line_no}: {message}" if line_no else message,
+            detail={"line_no": line_no},
+            status_code=422,
+        )
 
 
 class JSONLChunk:
     """Represents a chunk parsed from JSONL."""
 
+    # One instance per line on import: dropping the per-instance __dict__
+    # saves ~100 bytes per chunk on million-line files
+    __slots__ = ("text", "doc_id", "chunk_id", "metadata", "line_no")
+
     def __init__(
         self,
         text: str,
@@ -38,40 +48,177 @@ class JSONLChunk:
         self.line_no = line_no
 
 
-def parse_jsonl(content: bytes, default_doc_id: str) -> Tuple[List[JSONLChunk], List[str]]:
+async def aiter_upload_lines(
+    upload_file: Any, head: bytes = b"", chunk_size: int = 1 << 16
+) -> AsyncIterator[bytes]:
     """
-    Parse JSONL content into chunks.
+    Yield newline-delimited lines from an async upload without buffering
+    the whole file.
+
+    Reads `chunk_size` bytes at a time, scans the buffer for b'\\n' with
+    find() and advances a cursor, compacting the buffer once the consumed
+    prefix grows past one chunk.
 
     Args:
-        content: Raw JSONL file bytes
+        upload_file: Object with an async read(size) method (e.g. UploadFile)
+        head: Bytes already read from the upload (e.g. a sniffed header)
+        chunk_size: Read granularity in bytes
+
+    Yields:
+        Line contents as bytes, without the trailing newline
+    """
+    buf = bytearray(head)
+    pos = 0
+
+    # Split the pre-read head before touching the upload: if the sniffed
+    # head already holds the whole file (uploads smaller than the sniff
+    # size), the read loop below never runs
+    while (nl := buf.find(b"\n", pos)) != -1:
+        yield bytes(buf[pos:nl])
+        pos = nl + 1
+
+    while chunk := await upload_file.read(chunk_size):
+        buf.extend(chunk)
+        while (nl := buf.find(b"\n", pos)) != -1:
+            yield bytes(buf[pos:nl])
+            pos = nl + 1
+        if pos > chunk_size:
+            del buf[:pos]
+            pos = 0
+
+    if pos < len(buf):
+        yield bytes(buf[pos:])
+
+
+async def parse_jsonl_stream(
+    lines: AsyncIterator[bytes],
+    default_doc_id: str,
+    warnings: List[str],
+) -> AsyncIterator[JSONLChunk]:
+    """
+    Parse a stream of JSONL lines into chunks, yielding them lazily.
+
+    Streaming counterpart of parse_jsonl: validation is identical, but
+    peak memory is one line plus whatever the caller accumulates, and the
+    caller can start processing chunks while later lines are still being
+    read.
+
+    Args:
+        lines: Async iterator over raw line bytes (without newlines)
         default_doc_id: Default doc_id to use if not specified in JSONL
+        warnings: List that non-fatal warnings are appended to
 
-    Returns:
-        Tuple of (list of JSONLChunk, list of warnings)
+    Yields:
+        JSONLChunk per valid line
 
     Raises:
-        JSONLParseError: If parsing fails
+        JSONLParseError: If parsing fails or no valid chunks are found
     """
-    try:
-        text_content = content.decode("utf-8")
-    except UnicodeDecodeError:
-        raise JSONLParseError("File is not valid UTF-8")
+    line_no = 0
+    chunk_count = 0
+
+    async for raw_line in lines:
+        line_no += 1
+        line = raw_line.strip()
+        if not line:
+            continue
+
+        try:
+            # orjson parses the raw bytes directly (UTF-8 validated in C),
+            # several times faster per line than stdlib json
+            obj = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            raise JSONLParseError(f"Invalid JSON: {e}", line_no)
+
+        if not isinstance(obj, dict):
+            raise JSONLParseError("Each line must be a JSON object", line_no)
+
+        # Validate required field
+        if "text" not in obj:
+            raise JSONLParseError("Missing required field 'text'", line_no)
+
+        text = obj["text"]
+        if not isinstance(text, str):
+            raise JSONLParseError("'text' must be a string", line_no)
+
+        if not text.strip():
+            warnings.append(f"Line {line_no}: empty text")
+            continue
+
+        # Optional fields
+        doc_id = obj.get("doc_id", default_doc_id)
+        chunk_id = obj.get("chunk_id")
+        metadata = obj.get("metadata", {})
+
+        if not isinstance(metadata, dict):
+            warnings.append(f"Line {line_no}: 'metadata' is not an object, ignoring")
+            metadata = {}
+
+        chunk_count += 1
+        yield JSONLChunk(
+            text=text,
+            doc_id=doc_id,
+            chunk_id=chunk_id,
+            metadata=metadata,
+            line_no=line_no,
+        )
 
-    lines = text_content.strip().split("\n")
-    if not lines or (len(lines) == 1 and not lines[0].strip()):
+    if line_no == 0:
         raise JSONLParseError("File is empty")
+    if chunk_count == 0:
+        raise JSONLParseError("No valid chunks found in file")
 
-    chunks: List[JSONLChunk] = []
-    warnings: List[str] = []
+    logger.info(f"Parsed {chunk_count} chunks from JSONL stream")
+
+
+def iter_jsonl(
+    content: bytes, default_doc_id: str, warnings: List[str]
+) -> Iterator[JSONLChunk]:
+    """
+    Parse JSONL content into chunks, yielding them lazily.
+
+    Generator backing parse_jsonl: callers that only need a prefix (e.g.
+    preview) consume just those chunks instead of materializing one
+    JSONLChunk per line of a potentially huge file.
+
+    Args:
+        content: Raw JSONL file bytes
+        default_doc_id: Default doc_id to use if not specified in JSONL
+        warnings: List that non-fatal warnings are appended to
+
+    Yields:
+        JSONLChunk per valid line
+
+    Raises:
+        JSONLParseError: If parsing fails or no valid chunks are found
+    """
+    if not content.strip():
+        raise JSONLParseError("File is empty")
 
-    for line_no, line in enumerate(lines, start=1):
-        line = line.strip()
+    chunk_count = 0
+
+    # Scan the raw bytes for newlines with find() and slice each line once;
+    # no whole-file decode and no intermediate list of split lines.
+    size = len(content)
+    pos = 0
+    line_no = 0
+    while pos <= size:
+        nl = content.find(b"\n", pos)
+        if nl == -1:
+            raw_line = content[pos:]
+            pos = size + 1
+        else:
+            raw_line = content[pos:nl]
+            pos = nl + 1
+
+        line_no += 1
+        line = raw_line.strip()
         if not line:
             continue
 
         try:
-            obj = json.loads(line)
-        except json.JSONDecodeError as e:
+            obj = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
             raise JSONLParseError(f"Invalid JSON: {e}", line_no)
 
         if not isinstance(obj, dict):
@@ -98,21 +245,85 @@ def parse_jsonl(content: bytes, default_doc_id: str) -> Tuple[List[JSONLChunk],
             warnings.append(f"Line {line_no}: 'metadata' is not an object, ignoring")
             metadata = {}
 
-        chunks.append(JSONLChunk(
+        chunk_count += 1
+        yield JSONLChunk(
             text=text,
             doc_id=doc_id,
             chunk_id=chunk_id,
             metadata=metadata,
             line_no=line_no,
-        ))
+        )
 
-    if not chunks:
+    if chunk_count == 0:
         raise JSONLParseError("No valid chunks found in file")
 
-    logger.info(f"Parsed {len(chunks)} chunks from JSONL")
+    logger.info(f"Parsed {chunk_count} chunks from JSONL")
+
+
+def parse_jsonl(content: bytes, default_doc_id: str) -> Tuple[List[JSONLChunk], List[str]]:
+    """
+    Parse JSONL content into chunks.
+
+    Args:
+        content: Raw JSONL file bytes
+        default_doc_id: Default doc_id to use if not specified in JSONL
+
+    Returns:
+        Tuple of (list of JSONLChunk, list of warnings)
+
+    Raises:
+        JSONLParseError: If parsing fails
+    """
+    warnings: List[str] = []
+    chunks = list(iter_jsonl(content, default_doc_id, warnings))
     return chunks, warnings
 
 
+async def validate_jsonl_preview_stream(
+    lines: AsyncIterator[bytes], default_doc_id: str, max_preview: int = 10
+) -> Dict[str, Any]:
+    """
+    Validate a JSONL line stream and return preview information.
+
+    Streaming counterpart of validate_jsonl_preview: counts chunks and
+    collects doc_ids on the fly, keeping only the first `max_preview`
+    chunks in memory instead of the full parsed list.
+
+    Args:
+        lines: Async iterator over raw line bytes (without newlines)
+        default_doc_id: Default doc_id
+        max_preview: Maximum number of chunks to include in preview
+
+    Returns:
+        Preview information dict
+    """
+    warnings: List[str] = []
+    preview_chunks: List[Dict[str, Any]] = []
+    doc_ids: set = set()
+    total_chunks = 0
+
+    async for chunk in parse_jsonl_stream(lines, default_doc_id, warnings):
+        total_chunks += 1
+        if chunk.doc_id:
+            doc_ids.add(chunk.doc_id)
+        if len(preview_chunks) < max_preview:
+            preview_chunks.append({
+                "line_no": chunk.line_no,
+                "doc_id": chunk.doc_id,
+                "chunk_id": chunk.chunk_id,
+                "text_preview": chunk.text[:100] + "..." if len(chunk.text) > 100 else chunk.text,
+                "char_len": len(chunk.text),
+                "metadata": chunk.metadata,
+            })
+
+    return {
+        "total_chunks": total_chunks,
+        "preview": preview_chunks,
+        "warnings": warnings,
+        "doc_ids": list(doc_ids),
+    }
+
+
 def validate_jsonl_preview(content: bytes, default_doc_id: str, max_preview: int = 10) -> Dict[str, Any]:
     """
     Validate JSONL and return preview information.
@@ -125,22 +336,30 @@ def validate_jsonl_preview(content: bytes, default_doc_id: str, max_preview: int
     Returns:
         Preview information dict
     """
-    chunks, warnings = parse_jsonl(content, default_doc_id)
-
-    preview_chunks = []
-    for chunk in chunks[:max_preview]:
-        preview_chunks.append({
-            "line_no": chunk.line_no,
-            "doc_id": chunk.doc_id,
-            "chunk_id": chunk.chunk_id,
-            "text_preview": chunk.text[:100] + "..." if len(chunk.text) > 100 else chunk.text,
-            "char_len": len(chunk.text),
-            "metadata": chunk.metadata,
-        })
+    # Consume the generator directly: only the first max_preview chunks
+    # are kept, the rest are counted and dropped
+    warnings: List[str] = []
+    preview_chunks: List[Dict[str, Any]] = []
+    doc_ids: set = set()
+    total_chunks = 0
+
+    for chunk in iter_jsonl(content, default_doc_id, warnings):
+        total_chunks += 1
+        if chunk.doc_id:
+            doc_ids.add(chunk.doc_id)
+        if len(preview_chunks) < max_preview:
+            preview_chunks.append({
+                "line_no": chunk.line_no,
+                "doc_id": chunk.doc_id,
+                "chunk_id": chunk.chunk_id,
+                "text_preview": chunk.text[:100] + "..." if len(chunk.text) > 100 else chunk.text,
+                "char_len": len(chunk.text),
+                "metadata": chunk.metadata,
+            })
 
     return {
-        "total_chunks": len(chunks),
+        "total_chunks": total_chunks,
         "preview": preview_chunks,
         "warnings": warnings,
-        "doc_ids": list(set(c.doc_id for c in chunks if c.doc_id)),
+        "doc_ids": list(doc_ids),
     }
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from openai import OpenAI
@@ -75,8 +76,16 @@ def initialize_embedding_models() -> None:
 
     logger.info(f"Testing {len(embedding_candidates)} embedding candidates: {embedding_candidates}")
 
-    # 3) 実際にリクエストして成功したモデルのみ登録
-    available = [m for m in embedding_candidates if _test_embedding(client, m)]
+    # 3) 実際にリクエストして成功したモデルのみ登録。
+    #    各テストは独立したI/Oなので並列に投げる（OpenAIクライアントは
+    #    スレッドセーフ）。mapは投入順に返すため候補の順序は保たれる。
+    with ThreadPoolExecutor(
+        max_workers=min(16, len(embedding_candidates))
+    ) as executor:
+        results = executor.map(
+            lambda model: _test_embedding(client, model), embedding_candidates
+        )
+        available = [m for m, ok in zip(embedding_candidates, results) if ok]
 
     if not available:
         raise RuntimeError(
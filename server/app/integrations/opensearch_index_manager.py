@@ -13,6 +13,13 @@ from .opensearch_client import get_opensearch_client
 
 logger = get_logger(__name__)
 
+# Maps every non-alphanumeric ASCII character to "_"; built once so the
+# char-class replacement is a single C-level translate instead of re.sub
+_SANITIZE_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if not c.isalnum()}
+)
+_MULTI_UNDERSCORE = re.compile(r"_+")
+
 
 def sanitize_model_key(model: str) -> str:
     """
@@ -26,14 +33,18 @@ def sanitize_model_key(model: str) -> str:
     Returns:
         Sanitized key (e.g., "text_embedding_3_large")
     """
-    # Replace any non-alphanumeric character with underscore
-    sanitized = re.sub(r"[^a-zA-Z0-9]", "_", model)
+    if model.isascii():
+        # Replace any non-alphanumeric character with underscore
+        sanitized = model.translate(_SANITIZE_TABLE)
+    else:
+        # Rare path: the table only covers ASCII, so filter per character
+        sanitized = "".join(
+            c if c.isascii() and c.isalnum() else "_" for c in model
+        )
     # Remove consecutive underscores
-    sanitized = re.sub(r"_+", "_", sanitized)
-    # Remove leading/trailing underscores
-    sanitized = sanitized.strip("_")
-    # Lowercase
-    return sanitized.lower()
+    sanitized = _MULTI_UNDERSCORE.sub("_", sanitized)
+    # Remove leading/trailing underscores, lowercase
+    return sanitized.strip("_").lower()
 
 
 def get_index_name(base_index: str, model: str) -> str:
@@ -61,13 +72,42 @@ def get_index_mapping_template(dimension: int) -> Dict[str, Any]:
     Returns:
         OpenSearch index mapping
     """
+    if settings.OPENSEARCH_KNN_ENGINE == "faiss":
+        # faiss doesn't take cosinesimil, but the embedding providers
+        # return unit-norm vectors, so L2 ordering matches cosine; the
+        # fp16 scalar quantizer halves graph memory with negligible
+        # recall loss
+        method: Dict[str, Any] = {
+            "name": "hnsw",
+            "space_type": "l2",
+            "engine": "faiss",
+            "parameters": {
+                "ef_construction": 128,
+                "m": 24,
+                "encoder": {"name": "sq", "parameters": {"type": "fp16"}},
+            },
+        }
+    else:
+        method = {
+            "name": "hnsw",
+            "space_type": "cosinesimil",
+            "engine": settings.OPENSEARCH_KNN_ENGINE,
+            "parameters": {
+                "ef_construction": 128,
+                "m": 24,
+            },
+        }
+
     return {
         "settings": {
             "index": {
                 "knn": True,
                 "knn.algo_param.ef_search": 100,
+                # Fan vector/text queries out across segments within a
+                # shard instead of scanning them serially
+                "search.concurrent_segment_search.enabled": True,
             },
-            "number_of_shards": 1,
+            "number_of_shards": settings.OPENSEARCH_NUMBER_OF_SHARDS,
             "number_of_replicas": 0,
         },
         "mappings": {
@@ -88,15 +128,7 @@ def get_index_mapping_template(dimension: int) -> Dict[str, Any]:
                 "vector": {
                     "type": "knn_vector",
                     "dimension": dimension,
-                    "method": {
-                        "name": "hnsw",
-                        "space_type": "cosinesimil",
-                        "engine": "nmslib",
-                        "parameters": {
-                            "ef_construction": 128,
-                            "m": 24,
-                        },
-                    },
+                    "method": method,
                 },
                 # Metadata
                 "metadata": {
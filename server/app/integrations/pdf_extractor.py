@@ -39,57 +39,62 @@ def extract_pdf_to_pages(
         raise PDFExtractFailedError(f"Failed to open PDF: {str(e)}")
 
     try:
-        pages: List[RawPage] = []
-        warnings: List[str] = []
-
-        page_count = len(doc)
-        empty_page_count = 0
-
-        for page_idx in range(page_count):
-            try:
-                page = doc[page_idx]
-                # Extract text from page
-                text = page.get_text("text")
-
-                # Normalize line endings
-                text = text.replace("\r\n", "\n")
-
-                # Track empty pages
-                if len(text.strip()) < 10:
-                    empty_page_count += 1
-
-                # Page numbers are 1-based
-                pages.append(RawPage(page_no=page_idx + 1, text=text))
-
-            except Exception as e:
-                warnings.append(f"PAGE_{page_idx + 1}_EXTRACT_ERROR: {str(e)}")
-                # Add empty page on error
-                pages.append(RawPage(page_no=page_idx + 1, text=""))
-
-        # Add warning if many pages are empty
-        empty_ratio = empty_page_count / page_count if page_count > 0 else 0
-        if empty_ratio > 0.5:
-            warnings.append(
-                f"TEXT_EMPTY_MANY_PAGES: {empty_page_count}/{page_count} pages have little or no text"
+        # The context manager closes the document on every exit path,
+        # releasing MuPDF's native buffers promptly instead of waiting
+        # for the handle to be garbage collected
+        with doc:
+            pages: List[RawPage] = []
+            warnings: List[str] = []
+
+            page_count = len(doc)
+            empty_page_count = 0
+
+            for page_idx in range(page_count):
+                try:
+                    page = doc[page_idx]
+                    # Extract text from page
+                    text = page.get_text("text")
+
+                    # Normalize line endings; PyMuPDF emits plain "\n"
+                    # almost always, so the containment check skips a
+                    # full-page copy
+                    if "\r" in text:
+                        text = text.replace("\r\n", "\n")
+
+                    # Track empty pages; the length guard short-circuits
+                    # the strip() copy for blank pages
+                    if len(text) < 10 or len(text.strip()) < 10:
+                        empty_page_count += 1
+
+                    # Page numbers are 1-based
+                    pages.append(RawPage(page_no=page_idx + 1, text=text))
+
+                except Exception as e:
+                    warnings.append(f"PAGE_{page_idx + 1}_EXTRACT_ERROR: {str(e)}")
+                    # Add empty page on error
+                    pages.append(RawPage(page_no=page_idx + 1, text=""))
+
+            # Add warning if many pages are empty
+            empty_ratio = empty_page_count / page_count if page_count > 0 else 0
+            if empty_ratio > 0.5:
+                warnings.append(
+                    f"TEXT_EMPTY_MANY_PAGES: {empty_page_count}/{page_count} pages have little or no text"
+                )
+
+            # Create metadata
+            meta = ExtractMeta(
+                extractor_name=settings.PDF_EXTRACTOR,
+                extractor_version=extractor_version,
+                page_count=page_count,
+                warnings=warnings,
+                created_at=datetime.utcnow(),
             )
 
-        # Create metadata
-        meta = ExtractMeta(
-            extractor_name=settings.PDF_EXTRACTOR,
-            extractor_version=extractor_version,
-            page_count=page_count,
-            warnings=warnings,
-            created_at=datetime.utcnow(),
-        )
-
-        return pages, meta
+            return pages, meta
 
     except Exception as e:
         raise PDFExtractFailedError(f"Extraction failed: {str(e)}")
 
-    finally:
-        doc.close()
-
 
 def get_pdf_page_count(pdf_bytes: bytes) -> int:
     """
@@ -105,9 +110,7 @@ def get_pdf_page_count(pdf_bytes: bytes) -> int:
         PDFExtractFailedError: If PDF cannot be opened
     """
     try:
-        doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-        count = len(doc)
-        doc.close()
-        return count
+        with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+            return len(doc)
     except Exception as e:
         raise PDFExtractFailedError(f"Failed to open PDF: {str(e)}")
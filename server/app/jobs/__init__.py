@@ -1,6 +1,23 @@
-"""ChunkSmith Hybrid - Jobs Module"""
-
-from .runner import run_commit_job
-from .schemas import create_job, update_job_status
-
-__all__ = ["run_commit_job", "create_job", "update_job_status"]
+"""ChunkSmith Hybrid - Jobs Module"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict
+
+from ..core.config import settings
+from .runner import run_commit_job
+from .schemas import create_job, update_job_status
+
+# Shared pool for background commit jobs: bounds concurrency to
+# COMMIT_WORKERS and reuses warm threads instead of spawning a fresh
+# thread per session.
+_commit_pool = ThreadPoolExecutor(
+    max_workers=settings.COMMIT_WORKERS, thread_name_prefix="commit"
+)
+
+
+def submit_commit_job(job: Dict[str, Any]) -> None:
+    """Queue a commit job on the shared background pool."""
+    _commit_pool.submit(run_commit_job, job)
+
+
+__all__ = ["run_commit_job", "submit_commit_job", "create_job", "update_job_status"]
@@ -3,25 +3,29 @@ ChunkSmith Hybrid - Job Runner
 Background job execution for commit operations
 """
 
-from typing import Any, Dict, List
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional
 
 from ..core.config import settings
-from ..core.errors import OpenSearchDimensionMismatchError
 from ..core.logging import get_logger
-from ..core.models import ChunkMetadata, Session
+from ..core.models import ChunkMetadata, Session, _utcnow
 from ..core.storage import load_session, save_job
 from ..integrations.embeddings import get_embedding_provider
 from ..integrations.opensearch_client import get_opensearch_client
 from ..integrations.opensearch_index_manager import (
     ensure_index,
     get_default_index_name,
-    get_index_dimension,
 )
 from .schemas import update_job_status
 
 logger = get_logger(__name__)
 
+# Minimum seconds between persisted progress updates. Status transitions
+# and completion always save; only the in-loop progress ticks are
+# throttled, since nobody polls faster than this anyway.
+_PROGRESS_SAVE_INTERVAL = 1.0
+
 
 def run_commit_job(job: Dict[str, Any]) -> None:
     """
@@ -73,141 +77,206 @@ def run_commit_job(job: Dict[str, Any]) -> None:
         # Determine index name
         if custom_index_name:
             index_name = custom_index_name
-            # Check if index exists and validate dimension
-            client = get_opensearch_client()
-            if client.index_exists(index_name):
-                existing_dim = get_index_dimension(index_name)
-                if existing_dim != dimension:
-                    raise OpenSearchDimensionMismatchError(
-                        index_name=index_name,
-                        expected_dim=dimension,
-                        actual_dim=existing_dim,
-                    )
-                logger.info(f"Using existing index {index_name} with dimension {dimension}")
-            else:
-                logger.info(f"Creating new index {index_name} with dimension {dimension}")
         else:
             index_name = get_default_index_name(embedding_model)
 
-        # Ensure index exists with correct dimension
+        # Ensure index exists with correct dimension; raises
+        # OpenSearchDimensionMismatchError if an existing index disagrees
         ensure_index(index_name, dimension)
 
         logger.info(f"Using index {index_name} with dimension {dimension}")
 
-        # Extract chunk texts
-        texts = []
-        for chunk in chunks:
-            chunk_text = session.current_text[chunk.start : chunk.end]
-            texts.append(chunk_text)
+        # Extract chunk texts in one comprehension pass; the attribute
+        # lookup is hoisted so the loop is slice+append at C speed
+        current_text = session.current_text
+        texts = [current_text[chunk.start : chunk.end] for chunk in chunks]
+
+        # Embed each distinct chunk text once. chunk.hash is the identity
+        # of the text, and repeated boilerplate (headers, footers, legal
+        # notices) recurs many times per document; results are broadcast
+        # back to chunk order afterwards.
+        unique_pos: Dict[str, int] = {}
+        idx_map: List[int] = []
+        unique_texts: List[str] = []
+        for chunk, chunk_text in zip(chunks, texts):
+            pos = unique_pos.setdefault(chunk.hash, len(unique_texts))
+            if pos == len(unique_texts):
+                unique_texts.append(chunk_text)
+            idx_map.append(pos)
+
+        unique_total = len(unique_texts)
+        if unique_total < total:
+            logger.info(
+                f"Embedding {unique_total} unique texts for {total} chunks"
+            )
 
-        # Generate embeddings in batches
+        # Generate embeddings in batches, several in flight at once: each
+        # batch is a provider round-trip that mostly waits on HTTP, so
+        # concurrency is bounded by EMBED_CONCURRENCY, not the GIL.
+        # Results land at their batch offset, preserving order.
         batch_size = settings.OPENSEARCH_BULK_SIZE
-        all_embeddings: List[List[float]] = []
+        unique_embeddings: List[Optional[List[float]]] = [None] * unique_total
+        embed_errors: Dict[int, str] = {}
         error_samples: List[Dict[str, Any]] = []
         failed_count = 0
 
-        for i in range(0, len(texts), batch_size):
-            batch_texts = texts[i : i + batch_size]
-            try:
-                batch_embeddings = provider.embed_texts(batch_texts)
-                all_embeddings.extend(batch_embeddings)
-            except Exception as e:
-                # Record error and fill with None
-                logger.error(f"Embedding batch {i // batch_size} failed: {str(e)}")
-                for j in range(len(batch_texts)):
-                    all_embeddings.append(None)
-                    failed_count += 1
-                    if len(error_samples) < 5:
-                        error_samples.append(
-                            {
-                                "chunk_index": i + j,
-                                "error": str(e),
-                            }
-                        )
-
-            # Update progress
-            progress = min(0.5, (i + len(batch_texts)) / total * 0.5)
-            job = update_job_status(job, "running", progress=progress)
-            save_job(job)
-
-        # Build bulk actions
-        actions = []
-        succeeded_count = 0
-
-        for idx, chunk in enumerate(chunks):
-            embedding = all_embeddings[idx] if idx < len(all_embeddings) else None
-
-            if embedding is None:
-                continue
-
-            # Get chunk text
-            chunk_text = texts[idx]
-
-            # Get metadata
-            metadata = session.chunk_metadata.get(
-                chunk.chunk_id, ChunkMetadata()
-            )
-
-            # Build document
-            doc = {
-                "doc_id": session.doc_id,
-                "session_id": session.session_id,
-                "chunk_id": chunk.chunk_id,
-                "page_no": chunk.page_no,
-                "start": chunk.start,
-                "end": chunk.end,
-                "char_len": chunk.char_len,
-                "text": chunk_text,
-                "hash": chunk.hash,
-                "vector": embedding,
-                "metadata": metadata.model_dump(),
-                "chunk_strategy": session.chunk_strategy.model_dump(),
-                "extractor_version": session.extract_meta.extractor_version,
-                "embedding": {
-                    "model": embedding_model,
-                    "dimension": dimension,
-                    "provider": "langchain_openai",
-                },
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat(),
+        offsets = range(0, unique_total, batch_size)
+        completed_batches = 0
+        last_progress_save = 0.0
+        with ThreadPoolExecutor(
+            max_workers=min(settings.EMBED_CONCURRENCY, len(offsets))
+        ) as executor:
+            futures = {
+                executor.submit(
+                    provider.embed_texts, unique_texts[i : i + batch_size]
+                ): i
+                for i in offsets
             }
+            for future in as_completed(futures):
+                i = futures[future]
+                batch_len = min(batch_size, unique_total - i)
+                try:
+                    unique_embeddings[i : i + batch_len] = future.result()
+                except Exception as e:
+                    # Record error; the batch's slots stay None
+                    logger.error(f"Embedding batch {i // batch_size} failed: {str(e)}")
+                    for j in range(i, i + batch_len):
+                        embed_errors[j] = str(e)
+
+                # Update progress (futures complete on this thread only),
+                # persisted at most once per interval
+                completed_batches += 1
+                now = time.monotonic()
+                if now - last_progress_save >= _PROGRESS_SAVE_INTERVAL:
+                    progress = min(
+                        0.5, completed_batches * batch_size / unique_total * 0.5
+                    )
+                    job = update_job_status(job, "running", progress=progress)
+                    save_job(job)
+                    last_progress_save = now
+
+        # Broadcast unique embeddings back to chunk order; chunks whose
+        # text failed to embed are counted and sampled here
+        all_embeddings = [unique_embeddings[pos] for pos in idx_map]
+        for idx, embedding in enumerate(all_embeddings):
+            if embedding is None:
+                failed_count += 1
+                if len(error_samples) < 5:
+                    error_samples.append(
+                        {
+                            "chunk_index": idx,
+                            "error": embed_errors.get(
+                                idx_map[idx], "embedding failed"
+                            ),
+                        }
+                    )
 
-            # Use hash as _id for idempotency
-            action = {
-                "_index": index_name,
-                "_id": chunk.hash,
-                "_source": doc,
-            }
-            actions.append(action)
-            succeeded_count += 1
+        # Build bulk actions. Everything identical across chunks is
+        # computed once here instead of per iteration: the strategy and
+        # embedding sub-dicts, the shared empty-metadata dump, and the
+        # session identifiers.
+        succeeded_count = 0
 
-        # Bulk insert
-        if actions:
+        doc_id = session.doc_id
+        strategy_dump = session.chunk_strategy.model_dump()
+        extractor_version = session.extract_meta.extractor_version
+        embedding_meta = {
+            "model": embedding_model,
+            "dimension": dimension,
+            "provider": "langchain_openai",
+        }
+        empty_metadata_dump = ChunkMetadata().model_dump()
+        # Dump each annotated chunk's metadata once up front; the bulk
+        # loop then does a dict lookup instead of a pydantic model_dump
+        # per chunk
+        metadata_dumps = {
+            chunk_id: metadata.model_dump()
+            for chunk_id, metadata in session.chunk_metadata.items()
+        }
+        # One canonical timestamp for the whole commit; the per-chunk
+        # timestamp pair was 2N allocations for values inside the same
+        # wall-clock instant anyway
+        now_iso = _utcnow().isoformat()
+
+        def iter_actions():
+            """Yield one bulk action per embedded chunk.
+
+            Streamed straight into the bulk helper so the full action
+            list — dominated by the vectors — is never resident; each
+            doc lives only until its bulk request is sent. Progress is
+            advanced every batch_size yields as the helper pulls.
+            """
+            nonlocal job, succeeded_count, last_progress_save
+
+            for idx, chunk in enumerate(chunks):
+                embedding = all_embeddings[idx]
+
+                if embedding is None:
+                    continue
+
+                # Get metadata (sparse: most chunks share the empty dump)
+                metadata_dump = metadata_dumps.get(chunk.chunk_id, empty_metadata_dump)
+
+                # Build document
+                doc = {
+                    "doc_id": doc_id,
+                    "session_id": session_id,
+                    "chunk_id": chunk.chunk_id,
+                    "page_no": chunk.page_no,
+                    "start": chunk.start,
+                    "end": chunk.end,
+                    "char_len": chunk.char_len,
+                    "text": texts[idx],
+                    "hash": chunk.hash,
+                    "vector": embedding,
+                    "metadata": metadata_dump,
+                    "chunk_strategy": strategy_dump,
+                    "extractor_version": extractor_version,
+                    "embedding": embedding_meta,
+                    "created_at": now_iso,
+                    "updated_at": now_iso,
+                }
+
+                succeeded_count += 1
+
+                # Update progress (50% to 100% for bulk insert),
+                # persisted at most once per interval
+                if succeeded_count % batch_size == 0:
+                    now = time.monotonic()
+                    if now - last_progress_save >= _PROGRESS_SAVE_INTERVAL:
+                        progress = 0.5 + (idx + 1) / total * 0.5
+                        job = update_job_status(job, "running", progress=progress)
+                        save_job(job)
+                        last_progress_save = now
+
+                # Use hash as _id for idempotency
+                yield {
+                    "_index": index_name,
+                    "_id": chunk.hash,
+                    "_source": doc,
+                }
+
+        # Bulk insert (streamed; skipped when every embedding failed)
+        if failed_count < total:
             client = get_opensearch_client()
 
-            # Process in batches
-            for i in range(0, len(actions), batch_size):
-                batch_actions = actions[i : i + batch_size]
-                try:
-                    result = client.bulk(batch_actions)
-                    if result.get("errors"):
-                        # Some items failed
-                        for error in result.get("errors", [])[:5]:
-                            if len(error_samples) < 5:
-                                error_samples.append(
-                                    {"bulk_error": str(error)}
-                                )
-                except Exception as e:
-                    logger.error(f"Bulk insert batch {i // batch_size} failed: {str(e)}")
-                    if len(error_samples) < 5:
-                        error_samples.append(
-                            {"batch_index": i // batch_size, "error": str(e)}
-                        )
-
-                # Update progress (50% to 100% for bulk insert)
-                progress = 0.5 + (i + len(batch_actions)) / len(actions) * 0.5
-                job = update_job_status(job, "running", progress=progress)
-                save_job(job)
+            try:
+                result = client.bulk(iter_actions(), chunk_size=batch_size)
+                for error in result.get("errors", []):
+                    if len(error_samples) >= 5:
+                        break
+                    error_samples.append({"bulk_error": str(error)})
+            except Exception as e:
+                logger.error(f"Bulk insert failed: {str(e)}")
+                if len(error_samples) < 5:
+                    error_samples.append({"error": str(e)})
+
+            # Bulk requests no longer refresh individually; one refresh
+            # here makes the whole import searchable
+            try:
+                client.refresh(index_name)
+            except Exception as e:
+                logger.error(f"Post-bulk refresh failed for {index_name}: {str(e)}")
 
         # Complete job
         final_status = "succeeded" if failed_count == 0 else "failed"
@@ -3,20 +3,26 @@ ChunkSmith Hybrid - FastAPI Application
 Main application entry point
 """
 
+import asyncio
+from typing import Optional
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import batches, chunks, embedding, indices, jobs, search, sessions
-from .core.config import settings
-from .core.errors import (
-    ChunkSmithError,
-    chunksmith_error_handler,
-    generic_exception_handler,
-    http_exception_handler,
-)
-from .core.models import HealthResponse
-from .core.storage import purge_storage
-from .integrations.openai_models import initialize_embedding_models
+from .core.config import settings
+from .core.errors import (
+    ChunkSmithError,
+    chunksmith_error_handler,
+    generic_exception_handler,
+    http_exception_handler,
+)
+from .core.logging import get_logger
+from .core.models import HealthResponse
+from .core.storage import purge_storage
+from .integrations.openai_models import initialize_embedding_models
+
+logger = get_logger(__name__)
 
 # Create FastAPI app
 app = FastAPI(
@@ -49,11 +55,37 @@ app.include_router(embedding.router)
 app.include_router(indices.router)
 
 
-@app.on_event("startup")
-def _startup_init() -> None:
-    if settings.CHUNKSMITH_CLEAR_STORAGE_ON_STARTUP:
-        purge_storage()
-    initialize_embedding_models()
+# Set once _run_startup_init finishes successfully; /readyz reports 503
+# until then. The task reference keeps the init task from being GC'd.
+_startup_complete = asyncio.Event()
+_startup_task: Optional["asyncio.Task[None]"] = None
+
+
+async def _run_startup_init() -> None:
+    """Run the blocking startup work off the event loop.
+
+    Storage purge walks the filesystem and model discovery probes the
+    embedding endpoint over the network; both run in worker threads so
+    the server accepts requests as soon as it binds. Order matters:
+    storage is purged before readiness flips so early clients never see
+    pre-purge state.
+    """
+    try:
+        if settings.CHUNKSMITH_CLEAR_STORAGE_ON_STARTUP:
+            await asyncio.to_thread(purge_storage)
+        await asyncio.to_thread(initialize_embedding_models)
+    except Exception as e:
+        # Leave readiness unset so probes keep failing; liveness
+        # (/healthz) stays green for debugging
+        logger.error(f"Startup initialization failed: {str(e)}")
+    else:
+        _startup_complete.set()
+
+
+@app.on_event("startup")
+async def _startup_init() -> None:
+    global _startup_task
+    _startup_task = asyncio.create_task(_run_startup_init())
 
 
 @app.get("/healthz", response_model=HealthResponse)
@@ -62,6 +94,16 @@ async def health_check() -> HealthResponse:
     return HealthResponse(status="ok", env=settings.CHUNKSMITH_ENV)
 
 
+@app.get("/readyz", response_model=HealthResponse)
+async def readiness_check() -> HealthResponse:
+    """Readiness endpoint; 503 until startup initialization completes."""
+    if not _startup_complete.is_set():
+        raise HTTPException(
+            status_code=503, detail="Startup initialization in progress"
+        )
+    return HealthResponse(status="ok", env=settings.CHUNKSMITH_ENV)
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API info."""
@@ -0,0 +1,61 @@
+"""
+Tests for JSONL upload line streaming
+"""
+
+import asyncio
+
+from app.integrations.jsonl_parser import aiter_upload_lines
+
+
+class _FakeUpload:
+    """Upload stub with an async read(size) over fixed bytes."""
+
+    def __init__(self, data: bytes = b""):
+        self._data = data
+        self._pos = 0
+
+    async def read(self, size: int) -> bytes:
+        chunk = self._data[self._pos : self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+
+def _collect(aiter):
+    async def run():
+        return [line async for line in aiter]
+
+    return asyncio.run(run())
+
+
+class TestAiterUploadLines:
+    """Tests for aiter_upload_lines."""
+
+    def test_head_only_upload(self):
+        """A multi-line head with an exhausted upload still splits lines.
+
+        Regression test: uploads smaller than the sniff size arrive
+        entirely as `head`, so splitting must not depend on the read
+        loop running.
+        """
+        payload = b'{"text": "a"}\n{"text": "b"}\n'
+        lines = _collect(aiter_upload_lines(_FakeUpload(), head=payload))
+        assert lines == [b'{"text": "a"}', b'{"text": "b"}']
+
+    def test_head_without_trailing_newline(self):
+        """The unterminated last line of a head-only upload is yielded."""
+        payload = b'{"text": "a"}\n{"text": "b"}'
+        lines = _collect(aiter_upload_lines(_FakeUpload(), head=payload))
+        assert lines == [b'{"text": "a"}', b'{"text": "b"}']
+
+    def test_line_spanning_head_and_stream(self):
+        """A line cut between the head and the first read is reassembled."""
+        head = b'{"text": "a"}\n{"te'
+        rest = b'xt": "b"}\n{"text": "c"}\n'
+        lines = _collect(aiter_upload_lines(_FakeUpload(rest), head=head))
+        assert lines == [b'{"text": "a"}', b'{"text": "b"}', b'{"text": "c"}']
+
+    def test_small_chunk_size(self):
+        """Lines larger than the read granularity come out intact."""
+        payload = b"".join(b'{"text": "%d"}\n' % i for i in range(20))
+        lines = _collect(aiter_upload_lines(_FakeUpload(payload), chunk_size=7))
+        assert lines == payload.splitlines()
@@ -0,0 +1,45 @@
+"""
+Property-based round-trip tests for page markers (requires hypothesis)
+"""
+
+import pytest
+
+hypothesis = pytest.importorskip("hypothesis")
+
+from hypothesis import given, settings, strategies as st
+
+from app.core.page_marker import build_text, parse_text
+from app.core.models import RawPage
+
+
+# parse_text requires markers 1..n in order, so page numbers are assigned
+# sequentially rather than drawn at random; texts containing the marker
+# prefix are excluded because build_text does not escape page content and
+# such pages cannot round-trip by design. Surrogates are excluded since
+# they are not valid in well-formed text.
+_pages_st = st.lists(
+    st.text(
+        alphabet=st.characters(blacklist_categories=("Cs",)),
+        max_size=200,
+    ).filter(lambda t: "<<<PAGE:" not in t),
+    min_size=1,
+    max_size=50,
+).map(
+    lambda texts: [
+        RawPage(page_no=i + 1, text=t) for i, t in enumerate(texts)
+    ]
+)
+
+
+@given(_pages_st)
+@settings(max_examples=200, deadline=100)
+def test_roundtrip_fuzz(pages):
+    """build_text/parse_text round-trip any marker-free page contents.
+
+    The deadline doubles as a perf tripwire: an example that takes over
+    100ms means build or parse went super-linear on some input shape.
+    """
+    parsed = parse_text(build_text(pages), expected_page_count=len(pages))
+    assert [(p.page_no, p.text) for p in parsed] == [
+        (p.page_no, p.text) for p in pages
+    ]